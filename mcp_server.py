@@ -356,7 +356,8 @@ async def call_tool(
 
         results = []
         for row in cursor.fetchall():
-            similarity = calculate_text_similarity(description, row["description"])
+            # Rows that can't reach min_similarity are cut off early and score 0.0
+            similarity = calculate_text_similarity(description, row["description"], min_similarity)
             if similarity >= min_similarity:
                 results.append(
                     {
@@ -174,7 +174,8 @@ def api_search_description():
 
     results = []
     for row in cursor.fetchall():
-        similarity = calculate_text_similarity(description, row["description"])
+        # Rows that can't reach min_similarity are cut off early and score 0.0
+        similarity = calculate_text_similarity(description, row["description"], min_similarity)
         if similarity >= min_similarity:
             results.append(
                 {
@@ -6,6 +6,7 @@ import json
 import sys
 from pathlib import Path
 from dsr_rate_extractor import extract_rates_from_dsr
+from extraction_utils import extract_keywords_from_description as _extract_keywords
 
 
 def convert_to_structured_format(input_file: Path, output_file: Path, volume_name: str):
@@ -67,38 +68,6 @@ def convert_to_structured_format(input_file: Path, output_file: Path, volume_nam
     return len(dsr_codes)
 
 
-def _extract_keywords(description: str) -> list:
-    """Extract searchable keywords from description."""
-    import re
-
-    text = description.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-
-    stop_words = {
-        "the",
-        "and",
-        "or",
-        "of",
-        "in",
-        "to",
-        "for",
-        "with",
-        "on",
-        "at",
-        "from",
-        "by",
-        "as",
-        "is",
-        "are",
-        "a",
-        "an",
-    }
-    words = text.split()
-    keywords = [w for w in words if len(w) > 2 and w not in stop_words]
-
-    return keywords
-
-
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
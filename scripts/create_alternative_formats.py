@@ -13,7 +13,7 @@ def create_csv_format(volume_files: list, output_dir: Path):
     """Convert structured JSON to combined CSV."""
     csv_file = output_dir / "DSR_combined.csv"
 
-    with open(csv_file, "w", encoding="utf-8", newline="", encoding="utf-8") as f:
+    with open(csv_file, "w", encoding="utf-8", newline="") as f:
         writer = csv.DictWriter(
             f,
             fieldnames=[
@@ -84,6 +84,9 @@ def create_sqlite_format(volume_files: list, output_dir: Path):
     cursor.execute("CREATE INDEX idx_section ON dsr_codes(section)")
     cursor.execute("CREATE INDEX idx_rate ON dsr_codes(rate)")
     cursor.execute("CREATE INDEX idx_unit ON dsr_codes(unit)")
+    cursor.execute(
+        "CREATE INDEX idx_dsr_codes_cover ON dsr_codes(code, volume, rate, description, unit, page)"
+    )
 
     # Load all volumes
     for vol_file in volume_files:
@@ -113,6 +116,8 @@ def create_sqlite_format(volume_files: list, output_dir: Path):
             )
 
     conn.commit()
+    # Planner statistics, so lookups pick the covering index
+    cursor.execute("ANALYZE dsr_codes")
 
     # Get statistics
     cursor.execute("SELECT COUNT(*) FROM dsr_codes")
@@ -46,6 +46,9 @@ def create_master_database(category_databases: Dict[str, Path], output_db: Path)
     cursor.execute("CREATE INDEX idx_rate ON dsr_codes(rate)")
     cursor.execute("CREATE INDEX idx_unit ON dsr_codes(unit)")
     cursor.execute("CREATE INDEX idx_category_code ON dsr_codes(category, code)")
+    cursor.execute(
+        "CREATE INDEX idx_dsr_codes_cover ON dsr_codes(code, volume, rate, description, unit, page)"
+    )
 
     total_codes = 0
     category_counts = {}
@@ -101,6 +104,8 @@ def create_master_database(category_databases: Dict[str, Path], output_db: Path)
         source_conn.close()
 
     conn.commit()
+    # Planner statistics, so lookups pick the covering index
+    cursor.execute("ANALYZE dsr_codes")
 
     # Print summary
     print(f"\n{'='*60}")
@@ -171,6 +176,10 @@ def migrate_existing_database(old_db: Path, new_db: Path, category: str = "civil
     new_cursor.execute("CREATE INDEX IF NOT EXISTS idx_category ON dsr_codes(category)")
     new_cursor.execute("CREATE INDEX IF NOT EXISTS idx_code ON dsr_codes(code)")
     new_cursor.execute("CREATE INDEX IF NOT EXISTS idx_category_code ON dsr_codes(category, code)")
+    new_cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dsr_codes_cover "
+        "ON dsr_codes(code, volume, rate, description, unit, page)"
+    )
 
     # Insert with category
     for row in rows:
@@ -183,6 +192,7 @@ def migrate_existing_database(old_db: Path, new_db: Path, category: str = "civil
         )
 
     new_conn.commit()
+    new_cursor.execute("ANALYZE dsr_codes")
     print(f"✅ Migrated {len(rows)} codes to {new_db.name}")
 
     old_conn.close()
@@ -131,7 +131,7 @@ def _extract_rates_simple_format(pages_data: List, volume_name: str) -> Dict[str
 
             # Description is everything between code and unit
             desc_lines = lines[1:-2]
-            description = " ".join(str(l).strip() for l in desc_lines)
+            description = " ".join([str(l).strip() for l in desc_lines])
 
             # Try to parse rate
             rate = _parse_rate_value(potential_rate)
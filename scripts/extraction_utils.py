@@ -5,27 +5,26 @@ to avoid code duplication.
 """
 
 import re
+import string
 from typing import Dict, List, Tuple, Optional, Callable
 
-
-def extract_keywords_from_description(description: str) -> List[str]:
-    """Extract keywords from description for categorization.
-
-    Args:
-        description: Text description to extract keywords from
-
-    Returns:
-        List of extracted keywords (filtered, lowercase)
-
-    Example:
-        >>> extract_keywords_from_description("Excavation in ordinary soil")
-        ['excavation', 'ordinary', 'soil']
-    """
-    text = description.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-
-    # Extract words (filter out common words)
-    stop_words = {
+# Maps ASCII punctuation to spaces. "_" is a word character for the regex
+# fallback, so it is kept here as well.
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation if c != "_"})
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_YEAR_IN_TEXT_RE = re.compile(r"\b(20\d{2})\b")
+_YEAR_CODE_IN_TEXT_RE = re.compile(r"\b20\d{2}-\d+\.\d+")
+_QTY_RE = re.compile(r"^\d+\.?\d+$")
+_NUMBER_RE = re.compile(r"^\d+\.?\d*$")
+_YEAR_LINE_RE = re.compile(r"^20\d{2}$")
+# A whole line holding a DSR code, either "15.7.4" or year-prefixed "2024-15.7.4"
+_CODE_LINE_RE = re.compile(r"^(?:(?P<year>20\d{2})-)?(?P<code>\d+\.\d+(?:\.\d+)?)$")
+
+# How many preceding blocks a standalone code may look back for a DSR marker
+_MARKER_LOOKBACK = 3
+
+_STOP_WORDS = frozenset(
+    {
         "the",
         "and",
         "or",
@@ -44,35 +43,100 @@ def extract_keywords_from_description(description: str) -> List[str]:
         "a",
         "an",
     }
+)
+_UNITS = frozenset({"Nos", "Cum", "Sqm", "Kg", "Metre", "Mtr", "Ltr", "Each"})
+# Column headers and unit names that never make a useful description
+_NOISE_TOKENS = _UNITS | frozenset({"Unit", "Qty", "Rate", "Amount", "DSR-"})
+
+
+def extract_keywords_from_description(description: str) -> List[str]:
+    """Extract keywords from description for categorization.
+
+    Args:
+        description: Text description to extract keywords from
+
+    Returns:
+        List of extracted keywords (filtered, lowercase)
+
+    Example:
+        >>> extract_keywords_from_description("Excavation in ordinary soil")
+        ['excavation', 'ordinary', 'soil']
+    """
+    text = description.lower()
+    if text.isascii():
+        text = text.translate(_PUNCT_TABLE)
+    else:
+        text = _NON_WORD_RE.sub(" ", text)
+
+    # Extract words (filter out common words)
     words = text.split()
-    keywords = [w for w in words if len(w) > 2 and w not in stop_words]
+    keywords = [w for w in words if len(w) > 2 and w not in _STOP_WORDS]
 
     return keywords
 
 
-def detect_dsr_block(block: Dict) -> Tuple[bool, bool]:
+def _strip_lines(lines: List) -> List[str]:
+    """Return block lines as stripped strings."""
+    return [str(line).strip() for line in lines]
+
+
+def _marker_year(stripped: List[str]) -> Optional[str]:
+    """Return the year of a "DSR-" marker block, or None if it is not one."""
+    text = " ".join(stripped)
+    if "DSR-" not in text.upper():
+        return None
+    year_match = _YEAR_IN_TEXT_RE.search(text)
+    return year_match.group(1) if year_match else None
+
+
+def _build_marker_index(stripped_blocks: List[List[str]]) -> List[Optional[Tuple[int, str]]]:
+    """Index the nearest DSR marker block at or before each block of a page.
+
+    Args:
+        stripped_blocks: Pre-stripped lines for every block on the page
+
+    Returns:
+        List where entry ``i`` is ``(marker_block_idx, year)`` for the last
+        marker block at or before block ``i``, or None if there is none
+    """
+    index: List[Optional[Tuple[int, str]]] = []
+    last_marker = None
+    for block_idx, stripped in enumerate(stripped_blocks):
+        year = _marker_year(stripped)
+        if year:
+            last_marker = (block_idx, year)
+        index.append(last_marker)
+    return index
+
+
+def detect_dsr_block(block: Dict, stripped: Optional[List[str]] = None) -> Tuple[bool, bool]:
     """Detect if a block contains DSR code patterns.
 
     Args:
         block: Block dict with 'lines' key
+        stripped: Pre-stripped lines of the block (computed if omitted)
 
     Returns:
         Tuple of (has_dsr_marker, has_standalone_code)
     """
-    lines = block.get("lines", [])
-    block_text = " ".join(str(line) for line in lines)
-
-    # Check for DSR marker
-    has_dsr_marker = "DSR-" in block_text.upper() or bool(
-        re.search(r"\b20\d{2}-\d+\.\d+", block_text)
-    )
+    if stripped is None:
+        stripped = _strip_lines(block.get("lines", []))
+    block_text = " ".join(stripped)
+
+    # Check for DSR marker; the year-code regex can only match if "20" occurs
+    if "DSR-" in block_text.upper():
+        has_dsr_marker = True
+    elif "20" in block_text:
+        has_dsr_marker = _YEAR_CODE_IN_TEXT_RE.search(block_text) is not None
+    else:
+        has_dsr_marker = False
 
     # Check for standalone code pattern
     has_standalone_code = False
-    if not has_dsr_marker and len(lines) <= 3:
-        for line in lines:
-            line_str = str(line).strip()
-            if re.match(r"^\d+\.\d+(?:\.\d+)?$", line_str):
+    if not has_dsr_marker and len(stripped) <= 3:
+        for line_str in stripped:
+            code_match = _CODE_LINE_RE.match(line_str)
+            if code_match and code_match.group("year") is None:
                 has_standalone_code = True
                 break
 
@@ -80,7 +144,11 @@ def detect_dsr_block(block: Dict) -> Tuple[bool, bool]:
 
 
 def extract_dsr_code_from_lines(
-    lines: List, block_idx: int, blocks: List
+    lines: List,
+    block_idx: int,
+    blocks: List,
+    stripped_blocks: Optional[List[List[str]]] = None,
+    marker_index: Optional[List[Optional[Tuple[int, str]]]] = None,
 ) -> Tuple[Optional[str], Optional[str]]:
     """Extract DSR code and clean code from block lines.
 
@@ -93,6 +161,8 @@ def extract_dsr_code_from_lines(
         lines: List of lines in current block
         block_idx: Index of current block
         blocks: All blocks for lookback
+        stripped_blocks: Pre-stripped lines for every block in ``blocks``
+        marker_index: Result of ``_build_marker_index`` for ``stripped_blocks``
 
     Returns:
         Tuple of (dsr_code, clean_code) or (None, None) if not found
@@ -100,61 +170,80 @@ def extract_dsr_code_from_lines(
     dsr_code = None
     clean_code = None
 
-    for i, line in enumerate(lines):
-        line_str = str(line).strip()
+    if stripped_blocks is None:
+        stripped = _strip_lines(lines)
+    else:
+        stripped = stripped_blocks[block_idx]
+
+    # Uppercase once per block; only blocks with a marker need per-line checks
+    block_has_marker = "DSR-" in " ".join(stripped).upper()
+
+    for i, line_str in enumerate(stripped):
+        code_match = _CODE_LINE_RE.match(line_str)
 
         # Pattern 1: "YYYY-15.7.4" (year-code)
-        year_code_match = re.match(r"^(20\d{2})-(\d+\.\d+(?:\.\d+)?)$", line_str)
-        if year_code_match:
-            year = year_code_match.group(1)
-            clean_code = year_code_match.group(2)
-            dsr_code = f"DSR-{year}-{clean_code}"
+        if code_match and code_match.group("year"):
+            clean_code = code_match.group("code")
+            dsr_code = f"DSR-{code_match.group('year')}-{clean_code}"
             break
 
         # Pattern 2: "DSR-" "YYYY-" "15.7.4" (separate lines)
-        if "DSR-" in line_str.upper():
+        if not code_match and block_has_marker and "DSR-" in line_str.upper():
             year = None
-            for j in range(i + 1, min(i + 3, len(lines))):
-                next_line = str(lines[j]).strip()
+            for j in range(i + 1, min(i + 3, len(stripped))):
+                next_line = stripped[j]
                 # Check for year
-                if not year and re.match(r"^20\d{2}$", next_line):
+                if not year and _YEAR_LINE_RE.match(next_line):
                     year = next_line
                 # Check for code (with or without year prefix)
-                code_match = re.match(r"^(?:(20\d{2})-)?(\d+\.\d+(?:\.\d+)?)$", next_line)
-                if code_match:
-                    if not year and code_match.group(1):
-                        year = code_match.group(1)
-                    clean_code = code_match.group(2)
+                next_match = _CODE_LINE_RE.match(next_line)
+                if next_match:
+                    if not year and next_match.group("year"):
+                        year = next_match.group("year")
+                    clean_code = next_match.group("code")
                     dsr_code = f"DSR-{year}-{clean_code}"
                     break
             if dsr_code:
                 break
 
         # Pattern 3: "15.3" (standalone, lookback for DSR markers)
-        if not dsr_code and re.match(r"^\d+\.\d+(?:\.\d+)?$", line_str):
-            for prev_offset in range(1, min(4, block_idx + 1)):
-                prev_block = blocks[block_idx - prev_offset]
-                prev_lines = prev_block.get("lines", [])
-                prev_text = " ".join(str(l) for l in prev_lines)
-                # Look for DSR- and any year (20XX)
-                year_match = re.search(r"\b(20\d{2})\b", prev_text)
-                if "DSR-" in prev_text.upper() and year_match:
-                    year = year_match.group(1)
-                    clean_code = line_str
-                    dsr_code = f"DSR-{year}-{clean_code}"
-                    break
-            if dsr_code:
+        if code_match:
+            year = None
+            if marker_index is not None:
+                marker = marker_index[block_idx - 1] if block_idx > 0 else None
+                if marker and block_idx - marker[0] <= _MARKER_LOOKBACK:
+                    year = marker[1]
+            else:
+                lookback_start = max(0, block_idx - _MARKER_LOOKBACK)
+                if stripped_blocks is None:
+                    lookback = (
+                        _strip_lines(prev_block.get("lines", []))
+                        for prev_block in reversed(blocks[lookback_start:block_idx])
+                    )
+                else:
+                    lookback = reversed(stripped_blocks[lookback_start:block_idx])
+                for prev_lines in lookback:
+                    # Look for DSR- and any year (20XX)
+                    year = _marker_year(prev_lines)
+                    if year:
+                        break
+            if year:
+                clean_code = line_str
+                dsr_code = f"DSR-{year}-{clean_code}"
                 break
 
     return dsr_code, clean_code
 
 
-def extract_item_details(blocks: List, block_idx: int) -> Tuple[str, str, str]:
+def extract_item_details(
+    blocks: List, block_idx: int, stripped_blocks: Optional[List[List[str]]] = None
+) -> Tuple[str, str, str]:
     """Extract description, unit, and quantity from nearby blocks.
 
     Args:
         blocks: All blocks to search
         block_idx: Starting block index
+        stripped_blocks: Pre-stripped lines for every block in ``blocks``
 
     Returns:
         Tuple of (description, unit, quantity)
@@ -164,66 +253,44 @@ def extract_item_details(blocks: List, block_idx: int) -> Tuple[str, str, str]:
     quantity = ""
 
     # Search next blocks for description, unit, quantity
-    for offset in range(1, min(6, len(blocks) - block_idx)):
-        check_block = blocks[block_idx + offset]
-        check_lines = check_block.get("lines", [])
-
-        # Extract description (filter noise)
-        for line in check_lines:
-            line_text = str(line).strip()
-            if (
-                len(line_text) > 15
-                and not re.match(r"^\d+\.?\d*$", line_text)
-                and line_text
-                not in [
-                    "Nos",
-                    "Cum",
-                    "Sqm",
-                    "Kg",
-                    "Metre",
-                    "Mtr",
-                    "Ltr",
-                    "Each",
-                    "Unit",
-                    "Qty",
-                    "Rate",
-                    "Amount",
-                    "DSR-",
-                ]
-                and "DSR" not in line_text.upper()
-                and not re.match(r"^20\d{2}$", line_text)
-            ):
-                if not description:
-                    description = line_text
-                    break
-
-        # Extract unit and quantity
-        for i, line in enumerate(check_lines):
-            line_text = str(line).strip()
-            if line_text in [
-                "Nos",
-                "Cum",
-                "Sqm",
-                "Kg",
-                "Metre",
-                "Mtr",
-                "Ltr",
-                "Each",
-            ]:
+    if stripped_blocks is None:
+        lookahead = (
+            _strip_lines(block.get("lines", [])) for block in blocks[block_idx + 1 : block_idx + 6]
+        )
+    else:
+        lookahead = stripped_blocks[block_idx + 1 : block_idx + 6]
+
+    for check_lines in lookahead:
+
+        # Single pass: unit lines pick up a nearby quantity, other lines are
+        # description candidates (filter noise)
+        unit_done = False
+        for i, line_text in enumerate(check_lines):
+            if line_text in _UNITS:
+                if unit_done:
+                    continue
                 unit = line_text
                 # Find nearby quantity value
                 for j in range(max(0, i - 2), min(i + 3, len(check_lines))):
-                    qty_text = str(check_lines[j]).strip()
-                    if qty_text != line_text and re.match(r"^\d+\.?\d+$", qty_text):
-                        try:
-                            val = float(qty_text)
-                            if 0.01 <= val <= 100000:
-                                quantity = qty_text
-                                break
-                        except Exception:
-                            pass
-                if unit and quantity:
-                    break
+                    qty_text = check_lines[j]
+                    # _QTY_RE only accepts plain decimals, so float() cannot fail
+                    if qty_text != line_text and _QTY_RE.match(qty_text):
+                        if 0.01 <= float(qty_text) <= 100000:
+                            quantity = qty_text
+                            break
+                unit_done = bool(quantity)
+            elif (
+                not description
+                and len(line_text) > 15
+                and not _NUMBER_RE.match(line_text)
+                and line_text not in _NOISE_TOKENS
+                and "DSR" not in line_text.upper()
+                and not _YEAR_LINE_RE.match(line_text)
+            ):
+                description = line_text
+
+            if unit_done and description:
+                break
 
         if description and unit and quantity:
             break
@@ -254,6 +321,11 @@ def process_blocks_for_dsr_items(
     # Parse pages for DSR codes
     for page_data in data.get("document", {}).get("pages_data", []):
         blocks = page_data.get("blocks", [])
+        # Stringify and strip every line once per page; lookback and
+        # lookahead below revisit the same blocks many times
+        stripped_blocks = [_strip_lines(block.get("lines", [])) for block in blocks]
+        # Built on the first candidate block so pages without codes skip it
+        marker_index = None
 
         for block_idx, block in enumerate(blocks):
             lines = block.get("lines", [])
@@ -261,16 +333,25 @@ def process_blocks_for_dsr_items(
                 continue
 
             # Check for DSR markers or standalone pattern
-            has_dsr_marker, has_standalone_code = detect_dsr_block(block)
+            has_dsr_marker, has_standalone_code = detect_dsr_block(
+                block, stripped_blocks[block_idx]
+            )
 
             if has_dsr_marker or has_standalone_code:
+                if marker_index is None:
+                    marker_index = _build_marker_index(stripped_blocks)
+
                 # Extract DSR code using shared utility
-                dsr_code, clean_code = extract_dsr_code_from_lines(lines, block_idx, blocks)
+                dsr_code, clean_code = extract_dsr_code_from_lines(
+                    lines, block_idx, blocks, stripped_blocks, marker_index
+                )
 
                 # Only proceed if we found a valid DSR code and haven't processed it
                 if dsr_code and clean_code and dsr_code not in processed_codes:
                     # Extract description, unit, quantity using shared utility
-                    description, unit, quantity = extract_item_details(blocks, block_idx)
+                    description, unit, quantity = extract_item_details(
+                        blocks, block_idx, stripped_blocks
+                    )
 
                     # Add item if we have at least code and description
                     if description:
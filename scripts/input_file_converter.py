@@ -10,14 +10,26 @@ from extraction_utils import (
     process_blocks_for_dsr_items,
     extract_keywords_from_description,
 )
+from json_utils import read_json_file, write_json_file
+
+# Lowercased unit names, shared by every item instead of one copy per item
+_UNIT_NAMES: Dict[str, str] = {}
+
+
+def _unit_name(unit: str) -> str:
+    """Return the interned lowercase form of a unit name."""
+    name = _UNIT_NAMES.get(unit)
+    if name is None:
+        name = _UNIT_NAMES[unit] = sys.intern(unit.lower())
+    return name
 
 
 def _process_item_for_structured_format(item: Dict, item_number: int, clean_code: str) -> Dict:
     """Process extracted item to add structured format fields."""
     # Parse chapter and section
     parts = clean_code.split(".")
-    chapter = parts[0] if parts else ""
-    section = ".".join(parts[:2]) if len(parts) >= 2 else clean_code
+    chapter = sys.intern(parts[0]) if parts else ""
+    section = sys.intern(".".join(parts[:2])) if len(parts) >= 2 else clean_code
 
     return {
         "item_number": item_number,
@@ -26,7 +38,7 @@ def _process_item_for_structured_format(item: Dict, item_number: int, clean_code
         "chapter": chapter,
         "section": section,
         "description": item["description"],
-        "unit": item["unit"].lower(),
+        "unit": _unit_name(item["unit"]),
         "quantity": float(item["quantity"]) if item["quantity"] else 0.0,
         "source": "input_file",
         "keywords": extract_keywords_from_description(item["description"]),
@@ -45,8 +57,7 @@ def convert_input_to_structured(input_file: Path, output_file: Path = None) -> P
     """Convert input JSON to structured format."""
 
     print(f"📂 Loading input file: {input_file.name}")
-    with open(input_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json_file(input_file)
 
     print("🔍 Extracting DSR items...")
     items = extract_input_items_structured(data)
@@ -65,8 +76,7 @@ def convert_input_to_structured(input_file: Path, output_file: Path = None) -> P
     }
 
     print(f"💾 Writing structured JSON to {output_file.name}...")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json_file(output, output_file)
 
     print(f"✅ Converted {len(items)} DSR items")
 
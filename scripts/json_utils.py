@@ -0,0 +1,54 @@
+"""Shared JSON file helpers for the scripts.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce equivalent documents.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def read_json_file(path: Union[str, Path]) -> Any:
+    """Parse a JSON file read in one go as bytes.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_file(data: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """Serialize data to a UTF-8 JSON file in a single write.
+
+    Args:
+        data: JSON-serializable object
+        path: Output file path
+        indent: Pretty-print with two-space indentation (default: True)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    Path(path).write_text(text, encoding="utf-8")
@@ -6,11 +6,20 @@ Provides consistent logging setup across all scripts with file and console outpu
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from datetime import datetime
 
 
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory when the file is first opened."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 def setup_script_logging(
     script_name: str, log_level: str = "INFO", log_dir: Path = None
 ) -> logging.Logger:
@@ -34,8 +43,13 @@ def setup_script_logging(
     logger = logging.getLogger(script_name)
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Close existing handlers (flushing any buffered records) to avoid duplicates
+    for handler in logger.handlers[:]:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+        logger.removeHandler(handler)
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -57,14 +71,20 @@ def setup_script_logging(
         project_root = Path(__file__).parents[1]
         log_dir = project_root / "data" / "logs"
 
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create log file with date
+    # Create log file with date (directory and file are created on first write)
     log_file = log_dir / f"{script_name}_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = _LazyFileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+
+    # Buffer file records so per-item debug logging doesn't write on every call.
+    # Warnings flush immediately, as does a full buffer; logging.shutdown()
+    # flushes the rest at exit.
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.WARNING, target=file_handler
+    )
+    buffered_handler.setLevel(logging.DEBUG)
+    logger.addHandler(buffered_handler)
 
     # Log startup message
     logger.debug("Logging initialized for %s", script_name)
@@ -89,8 +109,10 @@ def log_operation(logger: logging.Logger, operation: str, **kwargs):
         ...              sheets=3,
         ...              duration_ms=1500)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     context = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    logger.info("%s | {context}", operation)
+    logger.info("%s | %s", operation, context)
 
 
 def log_progress(logger: logging.Logger, current: int, total: int, item: str = "items"):
@@ -106,8 +128,10 @@ def log_progress(logger: logging.Logger, current: int, total: int, item: str = "
     Example:
         >>> log_progress(logger, 5, 10, "sheets")
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     percentage = (current / total * 100) if total > 0 else 0
-    logger.debug("Progress: %s/{total} {item} ({percentage:.1f}%)", current)
+    logger.debug("Progress: %s/%s %s (%.1f%%)", current, total, item, percentage)
 
 
 def log_error_with_context(logger: logging.Logger, error: Exception, context: dict = None):
@@ -125,5 +149,7 @@ def log_error_with_context(logger: logging.Logger, error: Exception, context: di
         ... except Exception as e:
         ...     log_error_with_context(logger, e, {'file': 'test.xlsx'})
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     context_str = " | ".join(f"{k}={v}" for k, v in (context or {}).items())
     logger.error(f"Error occurred | {context_str} | {type(error).__name__}: {error}", exc_info=True)
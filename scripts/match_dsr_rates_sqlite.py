@@ -5,30 +5,37 @@ Supports structured (recommended) and unstructured input formats.
 """
 
 import argparse
-import json
 import sqlite3
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Optional
+from json_utils import read_json_file, write_json_file
 from text_similarity import calculate_text_similarity
 from logging_utils import setup_script_logging
 
 # Setup logging
 logger = setup_script_logging("match_dsr_rates_sqlite")
 
+# Codes per lookup query; stays well below SQLite's bound-parameter limit
+_QUERY_BATCH_SIZE = 500
 
-def load_input_file(input_file: Path) -> List[Dict]:
+# Per-connection read tuning: 256 MiB memory map, 64 MiB page cache, RAM temp storage
+_READ_PRAGMAS = ("mmap_size=268435456", "cache_size=-65536", "temp_store=MEMORY")
+
+
+def load_input_file(input_file: Path, verbose: bool = True) -> List[Dict]:
     """Load and extract DSR items from structured or unstructured format."""
     logger.info("Loading input file: %s", input_file)
-    print(f"📂 Loading input file: {input_file.name}")
+    if verbose:
+        print(f"📂 Loading input file: {input_file.name}")
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json_file(input_file)
 
     # Detect format by metadata
     if "metadata" in data and data.get("metadata", {}).get("type") == "input_items":
         logger.info("Detected structured input format")
-        print("✅ Detected structured input format")
+        if verbose:
+            print("✅ Detected structured input format")
         items = data.get("items", [])
 
         # Map to matching format
@@ -46,18 +53,21 @@ def load_input_file(input_file: Path) -> List[Dict]:
                 }
             )
 
-        print(f"📊 Loaded {len(mapped_items)} items from structured format")
+        if verbose:
+            print(f"📊 Loaded {len(mapped_items)} items from structured format")
         return mapped_items
     else:
         # Fall back to extraction
-        print("⚠️  Detected unstructured input format (using extractor)")
-        print("💡 TIP: Convert to structured format for better accuracy:")
-        print(f"    python3 input_file_converter.py -i {input_file.name}\n")
+        if verbose:
+            print("⚠️  Detected unstructured input format (using extractor)")
+            print("💡 TIP: Convert to structured format for better accuracy:")
+            print(f"    python3 input_file_converter.py -i {input_file.name}\n")
 
         from dsr_extractor import extract_dsr_codes_from_lko
 
         items = extract_dsr_codes_from_lko(data)
-        print(f"📊 Extracted {len(items)} items from unstructured format")
+        if verbose:
+            print(f"📊 Extracted {len(items)} items from unstructured format")
         return items
 
 
@@ -70,14 +80,54 @@ def load_dsr_database(db_path: Path) -> sqlite3.Connection:
             f"DSR database not found: {db_path}\nRun create_alternative_formats.py first."
         )
 
-    conn = sqlite3.connect(db_path)
+    # Matching only reads, so read-only files and mounts work too
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
+    for pragma in _READ_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
     logger.debug("Database connection established")
     return conn
 
 
+def _fetch_dsr_rows(cursor: sqlite3.Cursor, codes: List[str]) -> Dict[str, List[sqlite3.Row]]:
+    """Fetch database rows for many codes at once, grouped by code.
+
+    Rows for each code keep the preferred order: later volumes first, then
+    lower rates.
+    """
+    rows_by_code: Dict[str, List[sqlite3.Row]] = {}
+    # Sorted so each batch reads one contiguous range of the code index
+    unique_codes = sorted({code for code in codes if code})
+
+    for start in range(0, len(unique_codes), _QUERY_BATCH_SIZE):
+        batch = unique_codes[start : start + _QUERY_BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        cursor.execute(
+            f"""
+            SELECT code, description, unit, rate, volume, page
+            FROM dsr_codes
+            WHERE code IN ({placeholders})
+            ORDER BY
+                code,
+                CASE
+                    WHEN volume LIKE '%II%' OR volume LIKE '%2%' THEN 1  -- Prefer later volumes (simpler data)
+                    ELSE 2
+                END,
+                rate ASC  -- Prefer lower rates
+        """,
+            batch,
+        )
+        for row in cursor.fetchall():
+            rows_by_code.setdefault(row["code"], []).append(row)
+
+    return rows_by_code
+
+
 def match_with_database(
-    lko_items: List[Dict], db_conn: sqlite3.Connection, similarity_threshold: float = 0.3
+    lko_items: List[Dict],
+    db_conn: sqlite3.Connection,
+    similarity_threshold: float = 0.3,
+    verbose: bool = True,
 ) -> List[Dict]:
     """Match items using SQLite database for fast lookups."""
     logger.info(
@@ -88,42 +138,34 @@ def match_with_database(
     cursor = db_conn.cursor()
     matched_items = []
 
-    for item in lko_items:
-        clean_code = item.get("clean_dsr_code", item["dsr_code"])
-
-        # Direct database lookup - get all matching codes (may have duplicates from different volumes)
-        cursor.execute(
-            """
-            SELECT code, description, unit, rate, volume, page
-            FROM dsr_codes 
-            WHERE code = ?
-            ORDER BY 
-                CASE 
-                    WHEN volume LIKE '%II%' OR volume LIKE '%2%' THEN 1  -- Prefer later volumes (simpler data)
-                    ELSE 2 
-                END,
-                rate ASC  -- Prefer lower rates
-        """,
-            (clean_code,),
-        )
-
-        results = cursor.fetchall()
+    # Look up every code up front (may have duplicates from different volumes).
+    # Codes are compared as text, like the TEXT code column, so numeric codes
+    # from JSON input still match and sort alongside string ones
+    clean_codes = [
+        str(code) if code is not None else ""
+        for code in (item.get("clean_dsr_code", item["dsr_code"]) for item in lko_items)
+    ]
+    rows_by_code = _fetch_dsr_rows(cursor, clean_codes)
+
+    for item, clean_code in zip(lko_items, clean_codes):
+        results = rows_by_code.get(clean_code, [])
         result = results[0] if results else None
 
         if result:
             # Calculate similarity
             similarity = calculate_text_similarity(item["description"], result["description"])
 
-            # Show if multiple entries exist
-            duplicate_info = f" ({len(results)} entries)" if len(results) > 1 else ""
+            if verbose:
+                # Show if multiple entries exist
+                duplicate_info = f" ({len(results)} entries)" if len(results) > 1 else ""
 
-            print(
-                f"  DSR {clean_code} - Database match{duplicate_info}, similarity: {similarity:.3f}"
-            )
-            print(f"    Input: {item['description'][:60]}...")
-            print(
-                f"    Match: {result['description'][:60]}... (Vol: {result['volume']}, Rate: ₹{result['rate']})"
-            )
+                print(
+                    f"  DSR {clean_code} - Database match{duplicate_info}, similarity: {similarity:.3f}"
+                )
+                print(f"    Input: {item['description'][:60]}...")
+                print(
+                    f"    Match: {result['description'][:60]}... (Vol: {result['volume']}, Rate: ₹{result['rate']})"
+                )
 
             if similarity >= similarity_threshold:
                 # Good match
@@ -136,9 +178,10 @@ def match_with_database(
                 item["similarity_score"] = similarity
             else:
                 # Code found but low similarity
-                print(
-                    f"  ⚠️  DSR {clean_code} found but similarity {similarity:.3f} below threshold"
-                )
+                if verbose:
+                    print(
+                        f"  ⚠️  DSR {clean_code} found but similarity {similarity:.3f} below threshold"
+                    )
                 item["rate"] = result["rate"]
                 item["dsr_description"] = result["description"]
                 item["dsr_unit"] = result["unit"]
@@ -169,6 +212,91 @@ def match_with_database(
     return matched_items
 
 
+def _summarize_matches(matched_items: List[Dict]) -> Dict:
+    """Count match types and total the amounts in a single pass."""
+    match_counts: Dict[str, int] = {}
+    total_amount = 0
+    for item in matched_items:
+        match_type = item.get("match_type")
+        match_counts[match_type] = match_counts.get(match_type, 0) + 1
+        amount = item.get("amount")
+        if amount:
+            total_amount += amount
+
+    return {
+        "total_items": len(matched_items),
+        "exact_matches": match_counts.get("exact_with_description_match", 0),
+        "code_match_description_mismatch": match_counts.get(
+            "code_match_but_description_mismatch", 0
+        ),
+        "not_found": match_counts.get("not_found", 0),
+        "total_estimated_amount": total_amount,
+    }
+
+
+def run_matching(
+    input_file: Path,
+    db_path: Path,
+    output_dir: Path,
+    similarity_threshold: float = 0.3,
+    verbose: bool = False,
+) -> Optional[Dict]:
+    """Match an input file's DSR items with the database and save the report.
+
+    The report is written to ``<output_dir>/<input stem>_matched_rates.json``.
+
+    Args:
+        input_file: Structured or unstructured input JSON
+        db_path: SQLite DSR database
+        output_dir: Directory for the report
+        similarity_threshold: Minimum description similarity for a match
+        verbose: Print progress messages
+
+    Returns:
+        The report dict, or None if the input file has no DSR items
+    """
+    # Load input file (structured or unstructured)
+    lko_items = load_input_file(input_file, verbose=verbose)
+
+    if not lko_items:
+        return None
+
+    # Connect to database
+    if verbose:
+        print("\n🔗 Connecting to DSR database...")
+    db_conn = load_dsr_database(db_path)
+
+    try:
+        if verbose:
+            # Get database statistics
+            cursor = db_conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM dsr_codes")
+            total_codes = cursor.fetchone()[0]
+            print(f"📊 Database loaded: {total_codes:,} DSR codes available\n")
+
+            print("Matching items with DSR database...")
+
+        # Match items using database
+        matched_items = match_with_database(
+            lko_items, db_conn, similarity_threshold=similarity_threshold, verbose=verbose
+        )
+    finally:
+        db_conn.close()
+
+    # Create output
+    output = {
+        "project": f"DSR Rate Matching from {input_file.name}",
+        "source_files": {"items": str(input_file), "rates_database": str(db_path)},
+        "summary": _summarize_matches(matched_items),
+        "matched_items": matched_items,
+    }
+
+    # Save output
+    output_file = output_dir / f"{input_file.stem}_matched_rates.json"
+    write_json_file(output, output_file)
+    return output
+
+
 def main(
     input_file: Path = None,
     db_path: Path = None,
@@ -191,57 +319,13 @@ def main(
         )
         print()
 
-    # Load input file (structured or unstructured)
-    lko_items = load_input_file(input_file)
-
-    if not lko_items:
+    output = run_matching(input_file, db_path, output_dir, similarity_threshold, verbose=True)
+    if output is None:
         print("❌ No DSR items found in input file")
         return
 
-    # Connect to database
-    print("\n🔗 Connecting to DSR database...")
-    db_conn = load_dsr_database(db_path)
-
-    # Get database statistics
-    cursor = db_conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM dsr_codes")
-    total_codes = cursor.fetchone()[0]
-    print(f"📊 Database loaded: {total_codes:,} DSR codes available\n")
-
-    # Match items using database
-    print("Matching items with DSR database...")
-    matched_items = match_with_database(
-        lko_items, db_conn, similarity_threshold=similarity_threshold
-    )
-
-    db_conn.close()
-
-    # Create output
-    output = {
-        "project": f"DSR Rate Matching from {input_file.name}",
-        "source_files": {"items": str(input_file), "rates_database": str(db_path)},
-        "summary": {
-            "total_items": len(matched_items),
-            "exact_matches": len(
-                [i for i in matched_items if i.get("match_type") == "exact_with_description_match"]
-            ),
-            "code_match_description_mismatch": len(
-                [
-                    i
-                    for i in matched_items
-                    if i.get("match_type") == "code_match_but_description_mismatch"
-                ]
-            ),
-            "not_found": len([i for i in matched_items if i.get("match_type") == "not_found"]),
-            "total_estimated_amount": sum([i["amount"] for i in matched_items if i.get("amount")]),
-        },
-        "matched_items": matched_items,
-    }
-
-    # Save output
+    matched_items = output["matched_items"]
     output_file = output_dir / f"{input_file.stem}_matched_rates.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
 
     # Print summary
     print("\n=== MATCHING SUMMARY ===")
@@ -11,31 +11,82 @@ Usage examples:
 
 """
 
-import json
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List
 
 import click
 
+from json_utils import read_json_file
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+# ijson prefix of every text line in a converted document
+_LINES_PREFIX = "document.pages_data.item.blocks.item.lines.item"
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
 
 def load_json(json_path: Path) -> Dict:
     """Load JSON data from file."""
-    with json_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json_file(json_path)
 
 
-def get_all_text_blocks(data: Dict) -> List[str]:
-    """Extract all text blocks from the JSON data."""
-    texts = []
+def iter_text_blocks(data: Dict) -> Iterator[str]:
+    """Yield the non-empty, stripped text lines of the JSON data in order."""
     for page in data.get("document", {}).get("pages_data", []):
         for block in page.get("blocks", []):
             lines = block.get("lines", [])
             for line in lines:
                 text = line.strip()
                 if text:
-                    texts.append(text)
-    return texts
+                    yield text
+
+
+def get_all_text_blocks(data: Dict) -> List[str]:
+    """Extract all text blocks from the JSON data."""
+    return list(iter_text_blocks(data))
+
+
+def iter_text_blocks_from_file(json_path: Path) -> Iterator[str]:
+    """Yield text lines straight from a JSON file.
+
+    Streams the file with ijson when it is installed, so large documents
+    never have to be loaded whole; otherwise falls back to load_json().
+    """
+    if ijson is None:
+        yield from iter_text_blocks(load_json(json_path))
+        return
+
+    with json_path.open("rb") as f:
+        for line in ijson.items(f, _LINES_PREFIX):
+            text = line.strip()
+            if text:
+                yield text
+
+
+def make_matcher(search_term: str) -> Callable[[str], bool]:
+    """Build a case-insensitive predicate for a search term.
+
+    Plain ASCII terms are matched with a lowercase substring test against
+    ASCII text; anything else (regex syntax or non-ASCII text) goes through
+    ``re`` so results are identical to a regex search.
+    """
+    pattern = re.compile(search_term, re.IGNORECASE)
+    if not search_term.isascii() or _REGEX_METACHARS.intersection(search_term):
+        return lambda text: pattern.search(text) is not None
+
+    needle = search_term.lower()
+
+    def matches(text: str) -> bool:
+        if text.isascii():
+            return needle in text.lower()
+        return pattern.search(text) is not None
+
+    return matches
 
 
 @click.command()
@@ -49,19 +100,17 @@ def get_all_text_blocks(data: Dict) -> List[str]:
 @click.option("--print-text", is_flag=True, help="Print all text blocks")
 @click.option("--search", "search_term", help="Search for text/regex in blocks")
 def main(json_path: Path, print_text: bool, search_term: str):
-    data = load_json(json_path)
-    texts = get_all_text_blocks(data)
-
     if print_text:
-        for i, text in enumerate(texts):
+        for i, text in enumerate(iter_text_blocks_from_file(json_path)):
             print(f"Block {i}: {text}")
     elif search_term:
-        pattern = re.compile(search_term, re.IGNORECASE)
-        matches = [text for text in texts if pattern.search(text)]
-        if matches:
-            for match in matches:
-                print(match)
-        else:
+        matches = make_matcher(search_term)
+        found = False
+        for text in iter_text_blocks_from_file(json_path):
+            if matches(text):
+                print(text)
+                found = True
+        if not found:
             print("No matches found.")
     else:
         print("Use --print-text or --search option.")
@@ -1,31 +1,121 @@
 #!/usr/bin/env python3
-"""Text similarity calculations using SequenceMatcher and keyword overlap."""
+"""Text similarity calculations using sequence matching and keyword overlap.
+
+The sequence ratio is the Indel ratio 2 * LCS / (len1 + len2), based on the
+longest common subsequence. RapidFuzz's C++ implementation is used when it
+is installed; otherwise a bit-parallel LCS in pure Python gives the same
+scores, so matches don't depend on which optional packages are present.
+"""
 
 import re
-from difflib import SequenceMatcher
+import string
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
+
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:  # pragma: no cover - optional dependency
+    _fuzz_ratio = None
+
+_KEEP_CHARS = frozenset(string.ascii_lowercase + string.digits)
+# Maps every ASCII character that is not a lowercase letter, digit or whitespace to a space
+_ASCII_NORMALIZE_TABLE = str.maketrans(
+    {chr(c): " " for c in range(128) if chr(c) not in _KEEP_CHARS and not chr(c).isspace()}
+)
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, turn punctuation into spaces and collapse whitespace."""
+    text = text.lower()
+    if text.isascii():
+        text = text.translate(_ASCII_NORMALIZE_TABLE)
+    else:
+        text = _NON_ALNUM_RE.sub(" ", text)
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=16384)
+def _prepare(text: str) -> Tuple[str, FrozenSet[str]]:
+    """Return the normalized text and its word set, cached per description."""
+    normalized = _normalize(text)
+    return normalized, frozenset(normalized.split())
+
+
+def _lcs_length(text1: str, text2: str) -> int:
+    """Length of the longest common subsequence (Hyyro's bit-parallel algorithm)."""
+    # One bit per character of text1, set where that character occurs
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(text1):
+        masks[char] = masks.get(char, 0) | (1 << i)
+
+    all_bits = (1 << len(text1)) - 1
+    row = all_bits
+    for char in text2:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & all_bits
+    return len(text1) - bin(row).count("1")
+
 
+def _sequence_ratio(text1: str, text2: str, score_cutoff: float = 0.0) -> float:
+    """Return the 0.0-1.0 Indel ratio of two normalized strings.
 
-def calculate_text_similarity(text1: str, text2: str) -> float:
-    """Calculate similarity (0.0-1.0) using sequence matching + keyword overlap."""
+    Ratios below ``score_cutoff`` may be reported as 0.0, which lets
+    RapidFuzz stop before finishing the full comparison.
+    """
+    if _fuzz_ratio is not None:
+        return _fuzz_ratio(text1, text2, score_cutoff=score_cutoff * 100) / 100.0
+
+    total_len = len(text1) + len(text2)
+    if not total_len:
+        return 1.0
+    return 2 * _lcs_length(text1, text2) / total_len
+
+
+@lru_cache(maxsize=8192)
+def calculate_text_similarity(text1: str, text2: str, min_similarity: float = 0.0) -> float:
+    """Calculate similarity (0.0-1.0) using sequence matching + keyword overlap.
+
+    Scores below ``min_similarity`` are reported as 0.0; pairs that cannot
+    reach it are rejected from their lengths or cut off inside the sequence
+    match without computing the full score.
+    """
     if not text1 or not text2:
         return 0.0
 
     # Normalize for comparison
-    text1_norm = re.sub(r"[^a-zA-Z0-9\s]", " ", text1.lower()).strip()
-    text2_norm = re.sub(r"[^a-zA-Z0-9\s]", " ", text2.lower()).strip()
+    text1_norm, words1 = _prepare(text1)
+    text2_norm, words2 = _prepare(text2)
+
+    # Add keyword matching
+    if words1 and words2:
+        common = len(words1 & words2)
+        keyword_similarity = common / (len(words1) + len(words2) - common)
+        sequence_weight = 0.7
+    else:
+        keyword_similarity = 0.0
+        sequence_weight = 1.0
 
-    text1_norm = re.sub(r"\s+", " ", text1_norm)
-    text2_norm = re.sub(r"\s+", " ", text2_norm)
+    score_cutoff = 0.0
+    if min_similarity > 0.0:
+        # The sequence ratio 2*M/T can't exceed 2*min(len)/(len1+len2)
+        total_len = len(text1_norm) + len(text2_norm)
+        if total_len:
+            max_ratio = 2 * min(len(text1_norm), len(text2_norm)) / total_len
+            if max_ratio * sequence_weight + keyword_similarity * 0.3 < min_similarity:
+                return 0.0
 
-    similarity = SequenceMatcher(None, text1_norm, text2_norm).ratio()
+        # Lowest sequence ratio that can still reach min_similarity, with a
+        # little slack so pairs exactly at the threshold survive rounding
+        needed = (min_similarity - keyword_similarity * 0.3) / sequence_weight
+        score_cutoff = max(needed - 1e-9, 0.0)
 
-    # Add keyword matching
-    words1 = set(text1_norm.split())
-    words2 = set(text2_norm.split())
+    similarity = _sequence_ratio(text1_norm, text2_norm, score_cutoff)
+    if similarity < score_cutoff:
+        return 0.0
 
-    if words1 and words2:
-        keyword_similarity = len(words1.intersection(words2)) / len(words1.union(words2))
+    if sequence_weight < 1.0:
         # Weighted combination: 70% sequence, 30% keywords
-        return (similarity * 0.7) + (keyword_similarity * 0.3)
+        similarity = (similarity * 0.7) + (keyword_similarity * 0.3)
 
-    return similarity
+    return similarity if similarity >= min_similarity else 0.0
@@ -9,7 +9,7 @@ import csv
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 
 
 def get_current_version(db_path: Path) -> int:
@@ -222,6 +222,52 @@ def update_rate(
     return True
 
 
+def bulk_update_rates(
+    db_path: Path, rates: Iterable[Tuple[str, str, float]], dry_run: bool = False
+) -> int:
+    """Update rates for many DSR codes in one transaction.
+
+    Prefer this over calling update_rate in a loop: all rows are written with
+    a single executemany and one commit, and the version is bumped once.
+
+    Args:
+        db_path: Path to DSR database
+        rates: (code, category, new_rate) tuples; a category of None updates
+            the code in every category
+        dry_run: Preview the number of updates without applying them
+
+    Returns:
+        Number of database rows updated
+    """
+    params = [(float(new_rate), code, category, category) for code, category, new_rate in rates]
+    print(f"\n📋 Updating {len(params)} rates")
+
+    if dry_run:
+        print("\n🔍 DRY RUN - No changes made")
+        return 0
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            cursor = conn.executemany(
+                "UPDATE dsr_codes SET rate = ? WHERE code = ? AND (? IS NULL OR category = ?)",
+                params,
+            )
+            updated = cursor.rowcount
+    finally:
+        conn.close()
+
+    if updated > 0:
+        change_log = f"Bulk rate update: {updated} rows"
+        new_version = increment_version(db_path, change_log)
+        print(f"✅ Updated {updated} rows")
+        print(f"📌 Database version: v{new_version - 1} → v{new_version}")
+    else:
+        print("⚠️  No matching codes found")
+
+    return updated
+
+
 def update_description(
     db_path: Path, code: str, new_description: str, category: str = None, dry_run: bool = False
 ):
@@ -1,15 +1,10 @@
 """EstimateX - Convert PDF files to JSON format and DSR rate matching."""
 
-import sys
-from pathlib import Path
+import importlib
 
 __version__ = "1.0.0"
 
-# Core converter
-from .converter import PDFConversionError, PDFToXMLConverter
-
-# Web application
-from .web import AnalyticsTracker, app, create_app
+from ._scripts import import_script
 
 # Helper utilities
 from .helpers import (
@@ -31,61 +26,58 @@ from .logging_config import (
     setup_logging,
 )
 
-# Import utility functions from scripts
+# The converter, web app and script-backed functions are imported on first
+# access (PEP 562), so ``import estimatex`` doesn't pull in PyMuPDF, Flask, the
+# matcher's log file setup or the extractors unless they are used.
+_LAZY_EXPORTS = {
+    # Core converter
+    "PDFToXMLConverter": ".converter",
+    "PDFConversionError": ".converter",
+    # Web application
+    "app": ".web",
+    "create_app": ".web",
+    "AnalyticsTracker": ".web",
+    # DSR Matching functions
+    "load_input_file": "match_dsr_rates_sqlite",
+    "load_dsr_database": "match_dsr_rates_sqlite",
+    "match_with_database": "match_dsr_rates_sqlite",
+    # DSR Extraction functions
+    "extract_dsr_codes_from_lko": "dsr_extractor",
+    "extract_rates_from_dsr": "dsr_rate_extractor",
+    # Input conversion
+    "convert_input_to_structured": "input_file_converter",
+    # Text similarity
+    "calculate_text_similarity": "text_similarity",
+    # Database management
+    "update_rate": "update_dsr_database",
+    "bulk_update_rates": "update_dsr_database",
+    "update_description": "update_dsr_database",
+    "add_new_code": "update_dsr_database",
+    "view_code": "update_dsr_database",
+    "show_version_history": "update_dsr_database",
+}
+
+
+def _import_export_module(module_name: str):
+    """Import the module providing a lazy export."""
+    if module_name.startswith("."):
+        return importlib.import_module(module_name, __name__)
+    return import_script(module_name)
 
-# Add scripts directory to path for imports
-_scripts_dir = Path(__file__).parents[2] / "scripts"
-if str(_scripts_dir) not in sys.path:
-    sys.path.insert(0, str(_scripts_dir))
 
-# DSR Matching functions
-try:
-    from scripts.match_dsr_rates_sqlite import (
-        load_input_file,
-        load_dsr_database,
-        match_with_database,
-    )
-except ImportError:
-    # Fallback if scripts not in path
-    from match_dsr_rates_sqlite import load_input_file, load_dsr_database, match_with_database
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# DSR Extraction functions
-try:
-    from scripts.dsr_extractor import extract_dsr_codes_from_lko
-    from scripts.dsr_rate_extractor import extract_rates_from_dsr
-except ImportError:
-    from dsr_extractor import extract_dsr_codes_from_lko
-    from dsr_rate_extractor import extract_rates_from_dsr
+    value = getattr(_import_export_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Input conversion
-try:
-    from scripts.input_file_converter import convert_input_to_structured
-except ImportError:
-    from input_file_converter import convert_input_to_structured
 
-# Text similarity
-try:
-    from scripts.text_similarity import calculate_text_similarity
-except ImportError:
-    from text_similarity import calculate_text_similarity
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Database management
-try:
-    from scripts.update_dsr_database import (
-        update_rate,
-        update_description,
-        add_new_code,
-        view_code,
-        show_version_history,
-    )
-except ImportError:
-    from update_dsr_database import (
-        update_rate,
-        update_description,
-        add_new_code,
-        view_code,
-        show_version_history,
-    )
 
 __all__ = [
     # Core
@@ -122,6 +114,7 @@ __all__ = [
     "calculate_text_similarity",
     # Database Management
     "update_rate",
+    "bulk_update_rates",
     "update_description",
     "add_new_code",
     "view_code",
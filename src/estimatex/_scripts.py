@@ -0,0 +1,28 @@
+"""Import access to the standalone modules in the repository's scripts/ directory.
+
+The scripts import each other as top-level modules (``from text_similarity
+import ...``), so their directory has to be on ``sys.path``. It is added the
+first time a script module is requested instead of when the package is imported.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).parents[2] / "scripts"
+
+
+def import_script(module_name: str) -> ModuleType:
+    """Import a module from scripts/ by its top-level name.
+
+    Args:
+        module_name: Script module name, e.g. ``"match_dsr_rates_sqlite"``
+
+    Returns:
+        The imported module
+    """
+    scripts_dir = str(SCRIPTS_DIR)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    return importlib.import_module(module_name)
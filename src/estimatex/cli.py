@@ -4,8 +4,6 @@ from pathlib import Path
 
 import click
 
-from .converter import PDFToXMLConverter
-
 
 @click.command()
 @click.argument("pdf_file", type=click.Path(exists=True))
@@ -18,8 +16,34 @@ from .converter import PDFToXMLConverter
 @click.option("--include-metadata", is_flag=True, help="Include PDF metadata in XML output")
 @click.option("--extract-tables", is_flag=True, help="Detect and extract tables from PDF")
 @click.option("--no-pretty", is_flag=True, help="Disable pretty-printing of XML")
-def main(pdf_file: str, output: str, include_metadata: bool, extract_tables: bool, no_pretty: bool):
+@click.option("--no-text", is_flag=True, help="Omit each page's plain text (blocks are kept)")
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes to convert pages with",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Reuse earlier output for an unchanged PDF from this directory",
+)
+def main(
+    pdf_file: str,
+    output: str,
+    include_metadata: bool,
+    extract_tables: bool,
+    no_pretty: bool,
+    no_text: bool,
+    workers: int,
+    cache_dir: str,
+):
     """Convert PDF to JSON format."""
+    # Imported here so --help and argument errors don't wait for PyMuPDF
+    from .converter import PDFToXMLConverter
+
     try:
         if not output:
             output = Path(pdf_file).with_suffix(".json")
@@ -32,6 +56,9 @@ def main(pdf_file: str, output: str, include_metadata: bool, extract_tables: boo
                 include_metadata=include_metadata,
                 extract_tables=extract_tables,
                 indent=2 if not no_pretty else None,
+                workers=workers,
+                cache_dir=cache_dir,
+                include_text=not no_text,
             )
 
         click.echo(f"✓ Successfully saved to {output}")
@@ -1,12 +1,24 @@
 """PDF to JSON converter using PyMuPDF."""
 
+import copy
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import fitz  # PyMuPDF
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +26,19 @@ class PDFConversionError(Exception):
     """Custom exception for PDF conversion errors."""
 
 
+def _convert_page_range(
+    pdf_path: str, start: int, end: int, extract_tables: bool, include_text: bool
+) -> List[Dict]:
+    """Convert pages [start, end) in a worker process with its own document."""
+    with PDFToXMLConverter(pdf_path) as converter:
+        return [
+            converter._convert_page_dict(
+                converter.doc[index], index + 1, extract_tables, include_text
+            )
+            for index in range(start, end)
+        ]
+
+
 class PDFToXMLConverter:
     """Convert PDF files to JSON format with advanced features.
 
@@ -33,15 +58,26 @@ class PDFToXMLConverter:
         PDFConversionError: If PDF cannot be opened or processed
     """
 
+    # Results kept by convert_page() and get_page_tables() for repeat calls
+    PAGE_CACHE_SIZE = 64
+    # PDFs up to this size (bytes) are read into memory and opened from there
+    IN_MEMORY_OPEN_LIMIT = 32 * 1024 * 1024
+
     def __init__(self, pdf_path: Union[str, Path]):
         """Initialize with PDF file path."""
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        self._fingerprint: Optional[str] = None
+        self._page_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
 
         try:
-            self.doc = fitz.open(str(self.pdf_path))
-            logger.info("Opened PDF: %s ({len(self.doc)} pages)", self.pdf_path.name)
+            if self.pdf_path.stat().st_size <= self.IN_MEMORY_OPEN_LIMIT:
+                # One read of the whole file instead of MuPDF's seeks into it
+                self.doc = fitz.open(stream=self.pdf_path.read_bytes(), filetype="pdf")
+            else:
+                self.doc = fitz.open(str(self.pdf_path))
+            logger.info("Opened PDF: %s (%d pages)", self.pdf_path.name, len(self.doc))
         except Exception as e:
             raise PDFConversionError(f"Failed to open PDF: {e}")
 
@@ -60,6 +96,11 @@ class PDFToXMLConverter:
         """Detect tables using text positioning analysis."""
         tables = []
 
+        # find_tables' default "lines" strategy builds cells only from vector
+        # graphics, so a page without any drawings can't have a table
+        if not page.get_cdrawings():
+            return tables
+
         tabs = page.find_tables()
 
         if tabs and tabs.tables:
@@ -84,12 +125,76 @@ class PDFToXMLConverter:
 
         return tables
 
-    def convert(self, include_metadata: bool = False, extract_tables: bool = False) -> Dict:
+    def _convert_page_dict(
+        self,
+        page: fitz.Page,
+        page_num: int,
+        extract_tables: bool = False,
+        include_text: bool = True,
+    ) -> Dict:
+        """Build the JSON structure for one page."""
+        rect = page.rect  # computed by MuPDF on every access
+        page_data = {
+            "number": page_num,
+            "width": rect.width,
+            "height": rect.height,
+            "blocks": [],
+        }
+
+        # Build the TextPage once and reuse it for both extractions. Image
+        # blocks are skipped below, so the TextPage is made without them.
+        textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+
+        # Extract text
+        if include_text:
+            text = page.get_text(textpage=textpage)
+            if text.strip():
+                page_data["text"] = text
+
+        # Extract text blocks with positions. "blocks" mode gives each block's
+        # lines already joined by newlines, without building the span dicts.
+        blocks = page.get_text("blocks", textpage=textpage)
+        del textpage
+
+        for x0, y0, x1, y1, block_text, _block_no, block_type in blocks:
+            if block_type == 0:  # Text block
+                lines = [line for line in block_text.split("\n") if line.strip()]
+                if lines:
+                    page_data["blocks"].append(
+                        {
+                            "bbox": [round(x0, 2), round(y0, 2), round(x1, 2), round(y1, 2)],
+                            "lines": lines,
+                        }
+                    )
+
+        # Extract tables if requested
+        if extract_tables:
+            tables = self._detect_tables(page)
+            if tables:
+                # The detected tables are fresh dicts already in output key order
+                for table_data in tables:
+                    table_data["bbox"] = [round(coord, 2) for coord in table_data["bbox"]]
+                page_data["tables"] = tables
+
+        return page_data
+
+    def convert(
+        self,
+        include_metadata: bool = False,
+        extract_tables: bool = False,
+        workers: int = 1,
+        include_text: bool = True,
+    ) -> Dict:
         """Convert PDF to JSON structure.
 
         Args:
             include_metadata: Whether to include PDF metadata
             extract_tables: Whether to detect and extract tables
+            workers: Number of processes to convert pages with. Each process
+                opens its own copy of the PDF, since PyMuPDF documents can't
+                be shared across processes or threads.
+            include_text: Whether to add each page's plain text; turning it off
+                skips that extraction when only the blocks are needed
 
         Returns:
             Dict representing the document structure
@@ -98,58 +203,27 @@ class PDFToXMLConverter:
 
         # Add metadata if requested
         if include_metadata:
-            metadata = self.doc.metadata
-            doc_data["metadata"] = {key: value for key, value in metadata.items() if value}
+            doc_data["metadata"] = self.metadata
+
+        page_count = len(self.doc)
+        workers = min(workers, page_count)
+        if workers > 1:
+            # Split the pages into one contiguous range per worker
+            bounds = [page_count * i // workers for i in range(workers + 1)]
+            ranges = [
+                (str(self.pdf_path), bounds[i], bounds[i + 1], extract_tables, include_text)
+                for i in range(workers)
+            ]
+            with multiprocessing.Pool(workers) as pool:
+                for pages in pool.starmap(_convert_page_range, ranges):
+                    doc_data["pages_data"].extend(pages)
+            return {"document": doc_data}
 
         # Process each page
-        for page_num, page in enumerate(self.doc, start=1):
-            page_data = {
-                "number": page_num,
-                "width": page.rect.width,
-                "height": page.rect.height,
-                "blocks": [],
-            }
-
-            # Extract text
-            text = page.get_text()
-            if text.strip():
-                page_data["text"] = text
-
-            # Extract text blocks with positions
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                if not block.get("type"):  # Text block
-                    block_data = {"bbox": [round(coord, 2) for coord in block["bbox"]], "lines": []}
-
-                    # Extract lines within block
-                    for line in block.get("lines", []):
-                        line_text = ""
-                        for span in line.get("spans", []):
-                            line_text += span.get("text", "")
-                        if line_text.strip():
-                            block_data["lines"].append(line_text)
-
-                    if block_data["lines"]:
-                        page_data["blocks"].append(block_data)
-
-            # Extract tables if requested
-            if extract_tables:
-                tables = self._detect_tables(page)
-                if tables:
-                    page_data["tables"] = []
-
-                    for table_data in tables:
-                        table_dict = {
-                            "index": table_data["index"],
-                            "bbox": [round(coord, 2) for coord in table_data["bbox"]],
-                            "rows": table_data["rows"],
-                            "row_count": table_data["row_count"],
-                            "col_count": table_data["col_count"],
-                        }
-                        page_data["tables"].append(table_dict)
-
-            doc_data["pages_data"].append(page_data)
+        append_page = doc_data["pages_data"].append
+        convert_page = self._convert_page_dict
+        for page_num, page in enumerate(self.doc.pages(), start=1):
+            append_page(convert_page(page, page_num, extract_tables, include_text))
 
         return {"document": doc_data}
 
@@ -159,6 +233,9 @@ class PDFToXMLConverter:
         include_metadata: bool = False,
         extract_tables: bool = False,
         indent: int = 2,
+        workers: int = 1,
+        cache_dir: Optional[Union[str, Path]] = None,
+        include_text: bool = True,
     ) -> None:
         """Convert PDF and save as JSON file.
 
@@ -167,14 +244,105 @@ class PDFToXMLConverter:
             include_metadata: Whether to include PDF metadata
             extract_tables: Whether to detect and extract tables
             indent: JSON indentation level
+            workers: Number of processes to convert pages with
+            cache_dir: Optional directory of previous outputs keyed by the PDF's
+                content, file name and these options; a hit is copied instead
+                of converting again
+            include_text: Whether to add each page's plain text
         """
-        data = self.convert(include_metadata=include_metadata, extract_tables=extract_tables)
-
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        cached_file = None
+        if cache_dir is not None:
+            # The output embeds the file name, so it is part of the key too
+            options = (include_metadata, extract_tables, indent, include_text)
+            key = f"{self.fingerprint}|{self.pdf_path.name}|{options}"
+            cached_file = Path(cache_dir) / (
+                hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + ".json"
+            )
+            if cached_file.exists():
+                logger.debug("Using cached conversion: %s", cached_file.name)
+                shutil.copyfile(cached_file, output_file)
+                return
+
+        if indent is None and workers <= 1:
+            # Compact output is written page by page without building the document
+            self.save_json_streaming(
+                output_file,
+                include_metadata=include_metadata,
+                extract_tables=extract_tables,
+                include_text=include_text,
+            )
+        else:
+            data = self.convert(
+                include_metadata=include_metadata,
+                extract_tables=extract_tables,
+                workers=workers,
+                include_text=include_text,
+            )
+            self._write_json(data, output_file, indent)
+
+        if cached_file is not None:
+            cached_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_file, cached_file)
+
+    @staticmethod
+    def _write_json(data: Dict, output_file: Path, indent: Optional[int]) -> None:
+        """Write the converted document to a file."""
+        # orjson only supports two-space indentation
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_INDENT_2 if indent else 0
+            output_file.write_bytes(orjson.dumps(data, option=option))
+            return
+
         with output_file.open("w", encoding="utf-8") as f:
             json.dump(data, f, indent=indent, ensure_ascii=False)
 
+    def save_json_streaming(
+        self,
+        output_path: str,
+        include_metadata: bool = False,
+        extract_tables: bool = False,
+        include_text: bool = True,
+    ) -> None:
+        """Convert PDF and write compact JSON to disk one page at a time.
+
+        Produces the same document as save_json, without indentation, while
+        holding only a single page in memory.
+
+        Args:
+            output_path: Path to save the JSON file
+            include_metadata: Whether to include PDF metadata
+            extract_tables: Whether to detect and extract tables
+            include_text: Whether to add each page's plain text
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+
+            def dumps(obj):
+                return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        header = dumps({"source": self.pdf_path.name, "pages": len(self.doc)})
+        with output_file.open("wb") as f:
+            # Reopen the header object to append the page list to it
+            f.write(b'{"document":' + header[:-1] + b',"pages_data":[')
+            write = f.write
+            convert_page = self._convert_page_dict
+            for page_num, page in enumerate(self.doc.pages(), start=1):
+                if page_num > 1:
+                    write(b",")
+                write(dumps(convert_page(page, page_num, extract_tables, include_text)))
+            f.write(b"]")
+            # Add metadata if requested, after the pages as in convert()
+            if include_metadata:
+                f.write(b',"metadata":' + dumps(self.metadata))
+            f.write(b"}}")
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -185,6 +353,7 @@ class PDFToXMLConverter:
 
     def close(self):
         """Close the PDF document and free resources."""
+        self._page_cache.clear()
         if self.doc:
             self.doc.close()
             logger.debug("Closed PDF: %s", self.pdf_path.name)
@@ -198,7 +367,8 @@ class PDFToXMLConverter:
         Args:
             pdf_path: Input PDF file path
             output_path: Output JSON file path
-            **kwargs: Additional arguments (include_metadata, extract_tables, indent)
+            **kwargs: Additional arguments (include_metadata, extract_tables, indent, workers,
+                cache_dir, include_text)
 
         Returns:
             Path to created JSON file
@@ -210,6 +380,70 @@ class PDFToXMLConverter:
             converter.save_json(output_path, **kwargs)
         return Path(output_path)
 
+    @classmethod
+    def convert_files(
+        cls,
+        pairs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[Path]:
+        """Convert many PDFs, one file per worker process.
+
+        Each process opens its own document. Files that fail to convert are
+        logged and left out of the result.
+
+        Args:
+            pairs: (pdf_path, output_path) pairs
+            max_workers: Number of processes (default: CPU count); 1 converts
+                the files one after another in this process
+            **kwargs: Additional arguments passed to convert_file
+
+        Returns:
+            Paths of the created JSON files, in input order
+
+        Example:
+            >>> PDFToXMLConverter.convert_files([("a.pdf", "a.json"), ("b.pdf", "b.json")])
+        """
+        pairs = [(Path(pdf_path), Path(output_path)) for pdf_path, output_path in pairs]
+        converted: Dict[int, Path] = {}
+        # No point starting more processes than there are files or CPUs to use
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+
+        if max_workers <= 1:
+            for index, (pdf_path, output_path) in enumerate(pairs):
+                try:
+                    converted[index] = cls.convert_file(pdf_path, output_path, **kwargs)
+                    logger.info("Converted: %s", pdf_path.name)
+                except Exception as e:
+                    logger.error("Failed to convert %s: %s", pdf_path.name, e)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(cls.convert_file, pdf_path, output_path, **kwargs): index
+                    for index, (pdf_path, output_path) in enumerate(pairs)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    pdf_name = pairs[index][0].name
+                    try:
+                        converted[index] = future.result()
+                        logger.info("Converted: %s", pdf_name)
+                    except Exception as e:
+                        logger.error("Failed to convert %s: %s", pdf_name, e)
+
+        return [converted[index] for index in sorted(converted)]
+
+    @property
+    def fingerprint(self) -> str:
+        """Get the BLAKE2b hash of the PDF file's content."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            with self.pdf_path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
     @property
     def page_count(self) -> int:
         """Get total number of pages."""
@@ -253,15 +487,19 @@ class PDFToXMLConverter:
         if page_num < 1 or page_num > len(self.doc):
             raise ValueError(f"Invalid page number: {page_num} (valid: 1-{len(self.doc)})")
 
-        page = self.doc[page_num - 1]
-        return self._detect_tables(page)
+        return self._cached_page_result(
+            ("tables", page_num), lambda: self._detect_tables(self.doc[page_num - 1])
+        )
 
-    def convert_page(self, page_num: int, extract_tables: bool = False) -> Dict:
+    def convert_page(
+        self, page_num: int, extract_tables: bool = False, include_text: bool = True
+    ) -> Dict:
         """Convert single page to JSON structure.
 
         Args:
             page_num: Page number (1-indexed)
             extract_tables: Whether to detect and extract tables
+            include_text: Whether to add the page's plain text
 
         Returns:
             Dict representing the page structure
@@ -272,51 +510,22 @@ class PDFToXMLConverter:
         if page_num < 1 or page_num > len(self.doc):
             raise ValueError(f"Invalid page number: {page_num} (valid: 1-{len(self.doc)})")
 
-        page = self.doc[page_num - 1]
-        page_data = {
-            "number": page_num,
-            "width": page.rect.width,
-            "height": page.rect.height,
-            "blocks": [],
-        }
-
-        # Extract text
-        text = page.get_text()
-        if text.strip():
-            page_data["text"] = text
-
-        # Extract text blocks with positions
-        blocks = page.get_text("dict")["blocks"]
-
-        for block in blocks:
-            if not block.get("type"):  # Text block
-                block_data = {"bbox": [round(coord, 2) for coord in block["bbox"]], "lines": []}
-
-                # Extract lines within block
-                for line in block.get("lines", []):
-                    line_text = ""
-                    for span in line.get("spans", []):
-                        line_text += span.get("text", "")
-                    if line_text.strip():
-                        block_data["lines"].append(line_text)
-
-                if block_data["lines"]:
-                    page_data["blocks"].append(block_data)
-
-        # Extract tables if requested
-        if extract_tables:
-            tables = self._detect_tables(page)
-            if tables:
-                page_data["tables"] = []
-
-                for table_data in tables:
-                    table_dict = {
-                        "index": table_data["index"],
-                        "bbox": [round(coord, 2) for coord in table_data["bbox"]],
-                        "rows": table_data["rows"],
-                        "row_count": table_data["row_count"],
-                        "col_count": table_data["col_count"],
-                    }
-                    page_data["tables"].append(table_dict)
+        return self._cached_page_result(
+            ("page", page_num, extract_tables, include_text),
+            lambda: self._convert_page_dict(
+                self.doc[page_num - 1], page_num, extract_tables, include_text
+            ),
+        )
 
-        return page_data
+    def _cached_page_result(self, key: Tuple, build: Callable[[], Any]) -> Any:
+        """Return a copy of a per-page result, building it on a cache miss."""
+        cache = self._page_cache
+        if key in cache:
+            cache.move_to_end(key)
+            result = cache[key]
+        else:
+            result = cache[key] = build()
+            if len(cache) > self.PAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+        # Callers get their own copy so they can't alter the cached result
+        return copy.deepcopy(result)
@@ -1,10 +1,15 @@
 """Helper functions and utilities for EstimateX library."""
 
+import importlib.metadata
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, List, Dict, Optional
 import sqlite3
 
+from ._scripts import import_script
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +27,17 @@ class DSRMatcherHelper:
         ...     print(f"{result['code']}: ₹{result['total_cost']}")
     """
 
+    # Fixed SQL text, so sqlite3's per-connection statement cache reuses the
+    # compiled statements across calls
+    _CODE_SQL = "SELECT * FROM dsr_rates WHERE clean_code = ? OR code = ?"
+    _DESCRIPTION_SQL = "SELECT * FROM dsr_rates WHERE description LIKE ? LIMIT ?"
+    # Lets SQLite answer the clean_code/code OR lookup with two index searches
+    _CODE_INDEXES = {
+        "idx_dsr_rates_clean_code": "CREATE INDEX IF NOT EXISTS idx_dsr_rates_clean_code "
+        "ON dsr_rates(clean_code)",
+        "idx_dsr_rates_code": "CREATE INDEX IF NOT EXISTS idx_dsr_rates_code ON dsr_rates(code)",
+    }
+
     def __init__(self, db_path: Union[str, Path]):
         """Initialize with DSR database path.
 
@@ -36,8 +52,31 @@ class DSRMatcherHelper:
             raise FileNotFoundError(f"Database not found: {db_path}")
 
         self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
         logger.info("Connected to DSR database: %s", self.db_path.name)
 
+    def create_code_indexes(self):
+        """Add the code lookup indexes to a database built without them.
+
+        This writes to the database, so it is never done implicitly; run it
+        once on a writable copy to speed up search_by_code and match_items.
+
+        Raises:
+            sqlite3.OperationalError: If the database is read-only
+        """
+        existing = {
+            row[0]
+            for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        missing = [sql for name, sql in self._CODE_INDEXES.items() if name not in existing]
+        if not missing:
+            return
+
+        with self.conn:
+            for sql in missing:
+                self.conn.execute(sql)
+        logger.info("Created code lookup indexes on dsr_rates")
+
     def match_items(self, items: List[Dict], similarity_threshold: float = 0.3) -> List[Dict]:
         """Match construction items with DSR rates.
 
@@ -48,33 +87,21 @@ class DSRMatcherHelper:
         Returns:
             List of matched results with rates and costs
         """
-        # Import directly from script to avoid cyclic import
-        import sys
-        from pathlib import Path as _Path
-
-        _scripts_dir = _Path(__file__).parents[2] / "scripts"
-        if str(_scripts_dir) not in sys.path:
-            sys.path.insert(0, str(_scripts_dir))
-
-        try:
-            from scripts.match_dsr_rates_sqlite import match_with_database
-        except ImportError:
-            from match_dsr_rates_sqlite import match_with_database
+        match_with_database = import_script("match_dsr_rates_sqlite").match_with_database
 
         # Ensure items have required fields
-        formatted_items = []
-        for item in items:
-            formatted_items.append(
-                {
-                    "dsr_code": item.get("code", ""),
-                    "clean_dsr_code": item.get("clean_code", item.get("code", "")),
-                    "description": item.get("description", ""),
-                    "quantity": item.get("quantity", 0),
-                    "unit": item.get("unit", ""),
-                    "chapter": item.get("chapter", ""),
-                    "section": item.get("section", ""),
-                }
-            )
+        formatted_items = [
+            {
+                "dsr_code": (code := item.get("code", "")),
+                "clean_dsr_code": item["clean_code"] if "clean_code" in item else code,
+                "description": item.get("description", ""),
+                "quantity": item.get("quantity", 0),
+                "unit": item.get("unit", ""),
+                "chapter": item.get("chapter", ""),
+                "section": item.get("section", ""),
+            }
+            for item in items
+        ]
 
         return match_with_database(formatted_items, self.conn, similarity_threshold)
 
@@ -87,16 +114,9 @@ class DSRMatcherHelper:
         Returns:
             DSR entry dict or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM dsr_rates WHERE clean_code = ? OR code = ?", (code.strip(), code.strip())
-        )
-        row = cursor.fetchone()
-
-        if row:
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, row))
-        return None
+        code = code.strip()
+        row = self.conn.execute(self._CODE_SQL, (code, code)).fetchone()
+        return dict(row) if row else None
 
     def search_by_description(self, description: str, limit: int = 10) -> List[Dict]:
         """Search for DSR entries by description keyword.
@@ -108,14 +128,8 @@ class DSRMatcherHelper:
         Returns:
             List of matching DSR entries
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM dsr_rates WHERE description LIKE ? LIMIT ?", (f"%{description}%", limit)
-        )
-        rows = cursor.fetchall()
-
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
+        rows = self.conn.execute(self._DESCRIPTION_SQL, (f"%{description}%", limit)).fetchall()
+        return [dict(row) for row in rows]
 
     def get_statistics(self) -> Dict:
         """Get database statistics.
@@ -123,21 +137,10 @@ class DSRMatcherHelper:
         Returns:
             Dict with total codes, categories, chapters
         """
-        cursor = self.conn.cursor()
-
-        # Total codes
-        cursor.execute("SELECT COUNT(*) FROM dsr_rates")
-        total_codes = cursor.fetchone()[0]
-
-        # Categories
-        cursor.execute("SELECT COUNT(DISTINCT category) FROM dsr_rates")
-        categories = cursor.fetchone()[0]
-
-        # Chapters
-        cursor.execute(
-            "SELECT COUNT(DISTINCT chapter_no) FROM dsr_rates WHERE chapter_no IS NOT NULL"
-        )
-        chapters = cursor.fetchone()[0]
+        # One scan for all three counts; COUNT(DISTINCT ...) already skips NULL chapters
+        total_codes, categories, chapters = self.conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT category), COUNT(DISTINCT chapter_no) FROM dsr_rates"
+        ).fetchone()
 
         return {
             "total_codes": total_codes,
@@ -192,6 +195,43 @@ def quick_convert(
     return data
 
 
+# Below this many files, starting worker processes costs more than it saves
+_MIN_PARALLEL_FILES = 4
+
+# Where quick_match looks for the DSR database, relative to the working directory
+_DSR_DATABASE_PATHS = (
+    Path("data/reference/DSR_combined.db"),
+    Path("reference_files/DSR_combined.db"),
+    Path("DSR_combined.db"),
+)
+
+
+def _detect_dsr_database(cwd: str) -> Path:
+    """Find the DSR database for a working directory.
+
+    Found paths are cached per directory. Each call re-checks the cached path
+    and the higher-priority candidates before it, so a deleted database or a
+    preferred one created later is picked up without a full search.
+    """
+    found = _search_dsr_database(cwd)
+    higher_priority = _DSR_DATABASE_PATHS[: _DSR_DATABASE_PATHS.index(found.relative_to(cwd))]
+    if not found.exists() or any((Path(cwd) / path).exists() for path in higher_priority):
+        _search_dsr_database.cache_clear()
+        found = _search_dsr_database(cwd)
+    return found
+
+
+@lru_cache(maxsize=8)
+def _search_dsr_database(cwd: str) -> Path:
+    """Search _DSR_DATABASE_PATHS; a failed search raises, so it isn't cached."""
+    for path in _DSR_DATABASE_PATHS:
+        candidate = Path(cwd) / path
+        if candidate.exists():
+            return candidate
+
+    raise FileNotFoundError("Could not auto-detect DSR database. Please provide db_path.")
+
+
 def quick_match(
     input_items: Union[List[Dict], str, Path],
     db_path: Union[str, Path] = None,
@@ -213,22 +253,10 @@ def quick_match(
         ... ])
         >>> total = sum(r['total_cost'] for r in results)
     """
-    # Import directly from scripts to avoid cyclic import
-    import sys
-    from pathlib import Path as _Path
-
-    _scripts_dir = _Path(__file__).parents[2] / "scripts"
-    if str(_scripts_dir) not in sys.path:
-        sys.path.insert(0, str(_scripts_dir))
-
-    try:
-        from scripts.match_dsr_rates_sqlite import (
-            load_input_file,
-            load_dsr_database,
-            match_with_database,
-        )
-    except ImportError:
-        from match_dsr_rates_sqlite import load_input_file, load_dsr_database, match_with_database
+    matcher = import_script("match_dsr_rates_sqlite")
+    load_input_file = matcher.load_input_file
+    load_dsr_database = matcher.load_dsr_database
+    match_with_database = matcher.match_with_database
 
     # Load items
     if isinstance(input_items, (str, Path)):
@@ -238,18 +266,7 @@ def quick_match(
 
     # Auto-detect database
     if db_path is None:
-        possible_paths = [
-            Path("data/reference/DSR_combined.db"),
-            Path("reference_files/DSR_combined.db"),
-            Path("DSR_combined.db"),
-        ]
-        for path in possible_paths:
-            if path.exists():
-                db_path = path
-                break
-
-        if db_path is None:
-            raise FileNotFoundError("Could not auto-detect DSR database. Please provide db_path.")
+        db_path = _detect_dsr_database(os.getcwd())
 
     # Match
     conn = load_dsr_database(Path(db_path))
@@ -261,13 +278,23 @@ def quick_match(
 
 
 def batch_convert_pdfs(
-    pdf_directory: Union[str, Path], output_directory: Optional[Union[str, Path]] = None, **kwargs
+    pdf_directory: Union[str, Path],
+    output_directory: Optional[Union[str, Path]] = None,
+    max_workers: Optional[int] = None,
+    **kwargs,
 ) -> List[Path]:
     """Convert all PDFs in a directory.
 
+    With four or more files and no max_workers, files are converted in worker
+    processes. On platforms that spawn them (Windows, macOS), call this from
+    under ``if __name__ == "__main__":`` in scripts, or pass max_workers=1.
+
     Args:
         pdf_directory: Directory containing PDF files
         output_directory: Output directory (same as input if None)
+        max_workers: Number of files converted in parallel processes
+            (default: CPU count, or 1 for fewer than four files; 1 converts
+            them one by one in this process)
         **kwargs: Converter options
 
     Returns:
@@ -283,17 +310,20 @@ def batch_convert_pdfs(
     out_dir = Path(output_directory) if output_directory else pdf_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    converted = []
-    for pdf_file in pdf_dir.glob("*.pdf"):
-        try:
-            output_file = out_dir / pdf_file.with_suffix(".json").name
-            PDFToXMLConverter.convert_file(pdf_file, output_file, **kwargs)
-            converted.append(output_file)
-            logger.info("Converted: %s", pdf_file.name)
-        except Exception:
-            logger.error("Failed to convert %s: {e}", pdf_file.name)
-
-    return converted
+    # scandir's entries already know whether they are files, so listing a large
+    # directory needs no extra stat per PDF
+    try:
+        with os.scandir(pdf_dir) as entries:
+            pairs = [
+                (Path(entry.path), out_dir / Path(entry.name).with_suffix(".json"))
+                for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    if max_workers is None and len(pairs) < _MIN_PARALLEL_FILES:
+        max_workers = 1
+    return PDFToXMLConverter.convert_files(pairs, max_workers=max_workers, **kwargs)
 
 
 def validate_dsr_database(db_path: Union[str, Path]) -> Dict:
@@ -363,33 +393,24 @@ def get_version_info() -> Dict:
         >>> info = get_version_info()
         >>> print(f"EstimateX version: {info['estimatex']}")
     """
-    import sys
-
-    try:
-        import fitz
+    return dict(_version_info())
 
-        pymupdf_version = fitz.version[0]
-    except Exception:
-        pymupdf_version = "unknown"
 
-    try:
-        import flask
-
-        flask_version = flask.__version__
-    except Exception:
-        flask_version = "not installed"
-
-    # Import version directly to avoid cyclic import at module level
-    import importlib.metadata
+@lru_cache(maxsize=1)
+def _version_info() -> Dict:
+    """Read the installed versions once; they don't change within a process."""
+    import sys
 
-    try:
-        __version__ = importlib.metadata.version("estimatex")
-    except Exception:
-        __version__ = "2.0.0"  # fallback
+    # Package metadata gives the versions without importing PyMuPDF or Flask
+    def installed_version(distribution: str, default: str) -> str:
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            return default
 
     return {
-        "estimatex": __version__,
+        "estimatex": installed_version("estimatex", "2.0.0"),
         "python": sys.version.split()[0],
-        "pymupdf": pymupdf_version,
-        "flask": flask_version,
+        "pymupdf": installed_version("PyMuPDF", "unknown"),
+        "flask": installed_version("Flask", "not installed"),
     }
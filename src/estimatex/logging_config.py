@@ -3,24 +3,43 @@
 import logging
 import json
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 import traceback
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    # Request context attributes copied onto the JSON record when set
+    CONTEXT_FIELDS = ("request_id", "user_id", "duration_ms")
+
     def __init__(self, service_name: str = "estimatex", include_trace: bool = True):
         super().__init__()
         self.service_name = service_name
         self.include_trace = include_trace
+        self._cached_second: Optional[int] = None
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Return the record's UTC ISO-8601 time, reusing the formatted second."""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int((created - second) * 1e6):06d}Z"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "service": self.service_name,
             "level": record.levelname,
             "logger": record.name,
@@ -30,9 +49,12 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
+        attrs = record.__dict__
+
         # Add extra fields if present
-        if hasattr(record, "extra"):
-            log_data.update(record.extra)
+        extra = attrs.get("extra")
+        if extra is not None:
+            log_data.update(extra)
 
         # Add exception info if present
         if record.exc_info and self.include_trace:
@@ -43,13 +65,15 @@ class StructuredFormatter(logging.Formatter):
             }
 
         # Add request context if available
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
-
+        for field in self.CONTEXT_FIELDS:
+            if field in attrs:
+                log_data[field] = attrs[field]
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the stdlib handles those
         return json.dumps(log_data, default=str)
 
 
@@ -68,15 +92,18 @@ class HumanReadableFormatter(logging.Formatter):
     def __init__(self, use_colors: bool = True):
         super().__init__()
         self.use_colors = use_colors and sys.stdout.isatty()
+        # Level names as displayed, colored once instead of on every record
+        self._level_names = {
+            level: f"{color}{level}{self.RESET}" if self.use_colors else level
+            for level, color in self.COLORS.items()
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record for human reading."""
         timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
 
         # Color the level if enabled
-        level = record.levelname
-        if self.use_colors and level in self.COLORS:
-            level = f"{self.COLORS[level]}{level}{self.RESET}"
+        level = self._level_names.get(record.levelname, record.levelname)
 
         # Build message
         parts = [
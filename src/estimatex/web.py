@@ -1,5 +1,16 @@
 from pathlib import Path
-from flask import Flask, render_template, request, redirect, url_for, send_file, flash, jsonify, g
+from flask import (
+    Flask,
+    render_template,
+    request,
+    redirect,
+    url_for,
+    send_file,
+    flash,
+    jsonify,
+    g,
+    make_response,
+)
 import os
 import re
 from datetime import datetime, timedelta
@@ -8,15 +19,19 @@ import json
 import markdown
 from markupsafe import Markup
 from werkzeug.utils import secure_filename
-import sys
 from typing import Dict, List, Tuple, Optional
-from difflib import SequenceMatcher
-from collections import defaultdict, deque
-import zipfile
-import io
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
 import time
 import random
-from .logging_config import get_logger, log_performance, log_error, setup_logging
+from ._scripts import import_script
+from .logging_config import get_logger, setup_logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 APP_ROOT = Path(__file__).parents[2]
 DATA_DIR = APP_ROOT / "data"
@@ -37,6 +52,8 @@ app = Flask(__name__, template_folder=str(APP_ROOT / "templates"))
 app.secret_key = "dev-secret"
 app.config["UPLOAD_FOLDER"] = str(UPLOADS)
 app.config["MAX_CONTENT_LENGTH"] = 500 * 1024 * 1024  # 500 MB
+# Behind nginx/Apache, let the front server send files (X-Sendfile) instead of Python
+app.use_x_sendfile = os.getenv("USE_X_SENDFILE") == "1"
 
 
 # Analytics tracking storage (in-memory for simplicity)
@@ -255,11 +272,53 @@ def basename_filter(path):
     return Path(path).name
 
 
-ALLOWED_EXT = {".pdf"}
+ALLOWED_EXT = frozenset({".pdf"})
+# Matching lines shown per file on the /search results page
+SEARCH_PREVIEW_MATCHES = 10
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, with orjson when it is installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _pretty_json(data) -> str:
+    """Format parsed JSON with two-space indentation for display."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _files_by_suffix(directory: Path, *suffixes: str) -> Dict[str, List[str]]:
+    """List a directory's file names per suffix, sorted, in one scandir pass.
+
+    A missing directory gives empty lists.
+    """
+    found: Dict[str, List[str]] = {suffix: [] for suffix in suffixes}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                for suffix in suffixes:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        found[suffix].append(entry.name)
+                        break
+    except FileNotFoundError:
+        pass
+
+    for names in found.values():
+        names.sort()
+    return found
 
 
 def allowed_file(filename):
-    return Path(filename).suffix.lower() in ALLOWED_EXT
+    # splitext treats a leading dot like Path.suffix does, without building a Path
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXT
 
 
 @app.route("/")
@@ -268,29 +327,19 @@ def index():
     files = {"input": [], "output": [], "reference": []}
 
     # Input files (original converted PDFs)
-    if INPUT_FILES.exists():
-        for json_file in sorted(INPUT_FILES.glob("*.json")):
-            files["input"].append(str(json_file.relative_to(APP_ROOT)))
+    prefix = INPUT_FILES.relative_to(APP_ROOT)
+    for name in _files_by_suffix(INPUT_FILES, ".json")[".json"]:
+        files["input"].append(str(prefix / name))
 
-    # Output reports (DSR matching results)
-    if OUTPUT_REPORTS.exists():
-        for json_file in sorted(OUTPUT_REPORTS.glob("*.json")):
-            files["output"].append(str(json_file.relative_to(APP_ROOT)))
-
-        # Also include CSV and markdown reports
-        for report_file in sorted(OUTPUT_REPORTS.glob("*.csv")):
-            files["output"].append(str(report_file.relative_to(APP_ROOT)))
-
-        for report_file in sorted(OUTPUT_REPORTS.glob("*.md")):
-            files["output"].append(str(report_file.relative_to(APP_ROOT)))
+    # Output reports (DSR matching results), also CSV and markdown reports
+    prefix = OUTPUT_REPORTS.relative_to(APP_ROOT)
+    for names in _files_by_suffix(OUTPUT_REPORTS, ".json", ".csv", ".md").values():
+        files["output"].extend(str(prefix / name) for name in names)
 
     # Reference files (DSR databases)
-    reference_dir = REFERENCE_FILES
-    if reference_dir.exists():
-        for ref_file in sorted(reference_dir.glob("*.json")):
-            files["reference"].append(str(ref_file.relative_to(APP_ROOT)))
-        for ref_file in sorted(reference_dir.glob("*.xml")):
-            files["reference"].append(str(ref_file.relative_to(APP_ROOT)))
+    prefix = REFERENCE_FILES.relative_to(APP_ROOT)
+    for names in _files_by_suffix(REFERENCE_FILES, ".json", ".xml").values():
+        files["reference"].extend(str(prefix / name) for name in names)
 
     # Check if any files exist
     has_files = any(files.values())
@@ -373,7 +422,10 @@ def view_json(filepath):
     else:
         json_path = EXAMPLES / filepath  # Legacy location
 
-    if not json_path.exists():
+    # One stat both checks the file exists and keys the JSON caches below
+    try:
+        stat = json_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         flash("File not found")
         return redirect(url_for("index"))
 
@@ -388,28 +440,105 @@ def view_json(filepath):
 
     elif file_extension == ".md":
         # Handle Markdown files
-        with json_path.open("r", encoding="utf-8") as f:
-            md_content = f.read()
-        return render_template("view_markdown.html", filename=json_path.name, md_content=md_content)
+        md_content, md_html = _markdown_view(str(json_path), stat.st_mtime_ns, stat.st_size)
+        return render_template(
+            "view_markdown.html", filename=json_path.name, md_content=md_content, md_html=md_html
+        )
 
     elif file_extension == ".json":
         # Handle JSON files - check if it's a matched rates file
-        with json_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        report, json_content = _json_view(str(json_path), stat.st_mtime_ns, stat.st_size)
 
         # If it's a matched rates file, show it in a formatted table
-        if "matched_items" in data and "summary" in data:
-            return render_template("view_report.html", report=data, filename=json_path.name)
+        if report is not None:
+            return render_template("view_report.html", report=report, filename=json_path.name)
         else:
-            # For other JSON files, show raw JSON
-            json_content = json.dumps(data, indent=2, ensure_ascii=False)
-            return f"<html><head><title>{json_path.name}</title></head><body><pre>{json_content}</pre></body></html>"
+            # For other JSON files, show raw JSON; unchanged files answer 304
+            response = make_response(
+                f"<html><head><title>{json_path.name}</title></head><body><pre>{json_content}</pre></body></html>"
+            )
+            response.set_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+            return response.make_conditional(request)
 
     else:
         flash("Unsupported file type")
         return redirect(url_for("index"))
 
 
+@lru_cache(maxsize=64)
+def _markdown_view(md_path: str, mtime_ns: int, size: int) -> Tuple[str, Markup]:
+    """Read a Markdown report and render it to HTML for /view.
+
+    Cached per file, modification time and size, like _json_view.
+    """
+    with open(md_path, "r", encoding="utf-8") as f:
+        md_content = f.read()
+    return md_content, markdown_filter(md_content)
+
+
+@lru_cache(maxsize=64)
+def _json_view(json_path: str, mtime_ns: int, size: int) -> Tuple[Optional[Dict], Optional[str]]:
+    """Load a JSON file for /view as (report, None) or (None, pretty-printed text).
+
+    Cached per file, modification time and size, like _searchable_texts.
+    """
+    data = _load_json(Path(json_path))
+    if "matched_items" in data and "summary" in data:
+        return data, None
+    return None, _pretty_json(data)
+
+
+@lru_cache(maxsize=256)
+def _searchable_texts(json_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Collect the stripped line texts of a converted JSON file for /search.
+
+    Cached per file, modification time and size, so repeated searches skip
+    the JSON parsing and a rewritten file is read again, even when the
+    filesystem's timestamps are too coarse to tell the versions apart.
+    """
+    data = _load_json(Path(json_path))
+
+    # Get all text blocks using correct JSON structure
+    texts = []
+    # Try both possible structures
+    pages_data = data.get("pages", []) or data.get("document", {}).get("pages_data", [])
+
+    for page in pages_data:
+        for block in page.get("blocks", []):
+            # Handle both line formats
+            lines = block.get("lines", [])
+            for line in lines:
+                if isinstance(line, str):
+                    # Simple string format
+                    texts.append(line.strip())
+                elif isinstance(line, dict) and "spans" in line:
+                    # Complex span format
+                    for span in line.get("spans", []):
+                        text = span.get("text", "").strip()
+                        if text:
+                            texts.append(text)
+
+    return tuple(texts)
+
+
+def _find_matches(
+    pattern: re.Pattern, texts: Tuple[str, ...], limit: int = SEARCH_PREVIEW_MATCHES
+) -> Tuple[List[Tuple[int, str]], int]:
+    """Return the first ``limit`` (index, text) matches and the total match count.
+
+    Lines after the last shown match are only counted, with the scan in C.
+    """
+    search_text = pattern.search
+    matches = []
+    for idx, text in enumerate(texts):
+        if search_text(text):
+            matches.append((idx, text))
+            if len(matches) == limit:
+                rest = sum(1 for _ in filter(search_text, islice(texts, idx + 1, None)))
+                return matches, limit + rest
+    return matches, len(matches)
+
+
 @app.route("/search", methods=["GET", "POST"])
 def search():
     if request.method == "POST":
@@ -420,6 +549,12 @@ def search():
 
         results = []
 
+        try:
+            pattern = re.compile(search_term, re.IGNORECASE)
+        except re.error:
+            # An invalid pattern matches nothing
+            return render_template("search_results.html", search_term=search_term, results=results)
+
         # Search in all directories - updated to new structure
         search_locations = [
             (INPUT_FILES, "data/examples/input_files/"),
@@ -429,49 +564,21 @@ def search():
 
         for location_path, url_prefix in search_locations:
             if location_path.exists():
-                for json_file in sorted(location_path.glob("*.json")):
+                for name in _files_by_suffix(location_path, ".json")[".json"]:
+                    json_file = location_path / name
                     try:
-                        with json_file.open("r", encoding="utf-8") as f:
-                            data = json.load(f)
-
-                        # Get all text blocks using correct JSON structure
-                        texts = []
-                        # Try both possible structures
-                        pages_data = data.get("pages", []) or data.get("document", {}).get(
-                            "pages_data", []
-                        )
-
-                        for page in pages_data:
-                            for block in page.get("blocks", []):
-                                # Handle both line formats
-                                lines = block.get("lines", [])
-                                for line in lines:
-                                    if isinstance(line, str):
-                                        # Simple string format
-                                        texts.append(line.strip())
-                                    elif isinstance(line, dict) and "spans" in line:
-                                        # Complex span format
-                                        for span in line.get("spans", []):
-                                            text = span.get("text", "").strip()
-                                            if text:
-                                                texts.append(text)
-
-                        # Search for matches with indices
-                        pattern = re.compile(search_term, re.IGNORECASE)
-                        matches_with_indices = []
-                        for idx, text in enumerate(texts):
-                            if pattern.search(text):
-                                matches_with_indices.append((idx, text))
+                        stat = json_file.stat()
+                        texts = _searchable_texts(str(json_file), stat.st_mtime_ns, stat.st_size)
+
+                        matches_with_indices, total_matches = _find_matches(pattern, texts)
 
                         if matches_with_indices:
                             results.append(
                                 {
                                     "filename": json_file.name,
                                     "filepath": url_prefix + json_file.name,
-                                    "matches": matches_with_indices[
-                                        :10
-                                    ],  # List of (index, text) tuples
-                                    "total_matches": len(matches_with_indices),
+                                    "matches": matches_with_indices,  # List of (index, text) tuples
+                                    "total_matches": total_matches,
                                     "search_term": search_term,  # Include search term for highlighting
                                 }
                             )
@@ -537,9 +644,8 @@ def download_json(jsonname):
 def get_input_files():
     """Get list of available input files"""
     files = []
-    if INPUT_FILES.exists():
-        for json_file in sorted(INPUT_FILES.glob("*.json")):
-            files.append({"name": json_file.name, "path": f"input_files/{json_file.name}"})
+    for name in _files_by_suffix(INPUT_FILES, ".json")[".json"]:
+        files.append({"name": name, "path": f"input_files/{name}"})
     return files
 
 
@@ -561,20 +667,10 @@ def get_reference_files():
 
 
 def process_cost_estimation(input_file: str, reference_files: List[str]) -> Dict:
-    """Process cost estimation by running the DSR matching script."""
+    """Process cost estimation by running the DSR matching script in-process."""
     try:
-        import subprocess
-
-        # Use the new SQLite-based matching script
-        script_path = APP_ROOT / "scripts" / "match_dsr_rates_sqlite.py"
         database_path = REFERENCE_FILES / "DSR_combined.db"
 
-        if not script_path.exists():
-            return {
-                "success": False,
-                "error": "DSR matching script not found. Please ensure match_dsr_rates_sqlite.py exists.",
-            }
-
         if not database_path.exists():
             return {
                 "success": False,
@@ -590,37 +686,20 @@ def process_cost_estimation(input_file: str, reference_files: List[str]) -> Dict
         if not input_path.exists():
             return {"success": False, "error": f"Input file not found: {input_file}"}
 
-        # Run the DSR matching script with the new SQLite approach
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(script_path),
-                "-i",
-                str(input_path),
-                "-d",
-                str(database_path),
-                "-o",
-                str(OUTPUT_REPORTS),
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(APP_ROOT / "scripts"),
-            check=False,
-        )
+        # Run the SQLite DSR matcher in-process; importing it once saves an
+        # interpreter start per estimate, and it stays quiet on the server's stdout
+        run_matching = import_script("match_dsr_rates_sqlite").run_matching
+        OUTPUT_REPORTS.mkdir(parents=True, exist_ok=True)
+        try:
+            output_data = run_matching(input_path, database_path, OUTPUT_REPORTS)
+        except Exception as e:
+            return {"success": False, "error": f"Script failed: {e}"}
 
-        if result.returncode:
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            return {"success": False, "error": f"Script failed: {error_msg}"}
+        if output_data is None:
+            return {"success": False, "error": f"No DSR items found in {input_path.name}"}
 
-        # Determine output file name based on input file name
+        # Output file name is based on the input file name
         output_filename = f"{input_path.stem}_matched_rates.json"
-        output_file = OUTPUT_REPORTS / output_filename
-
-        if not output_file.exists():
-            return {"success": False, "error": f"Output file not found: {output_filename}"}
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
 
         # Adapt the output format for the web interface
         summary = output_data.get("summary", {})
@@ -638,7 +717,6 @@ def process_cost_estimation(input_file: str, reference_files: List[str]) -> Dict
                 "total_amount": summary.get("total_estimated_amount", 0),
             },
             "result_file": output_filename,
-            "script_output": result.stdout,
         }
 
     except Exception as e:
@@ -749,22 +827,38 @@ def handle_exception(error):
     return render_template("500.html", error_details=error_details), 500
 
 
-if __name__ == "__main__":
-    try:
-        app.run(debug=True, host="0.0.0.0", port=8000)
-    except Exception as e:
-        print(f"Error starting app: {e}")
-        import traceback
+def _serve_production(host: str, port: int) -> None:
+    """Serve the app with gunicorn, whose workers send downloads with sendfile(2)."""
+    from gunicorn.app.base import BaseApplication
 
-        traceback.print_exc()
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", int(os.getenv("WEB_WORKERS", "4")))
+
+        def load(self):
+            return app
+
+    StandaloneApplication().run()
 
 
 def main():
-    """Entry point for the web server CLI command."""
+    """Entry point for the web server CLI command.
+
+    Set PROD=1 to serve with gunicorn (see requirements.txt) instead of the
+    Werkzeug debug server; WEB_WORKERS sets its worker count (default 4).
+    """
     try:
-        app.run(debug=True, host="0.0.0.0", port=8000)
+        if os.getenv("PROD") == "1":
+            _serve_production(host="0.0.0.0", port=8000)
+        else:
+            app.run(debug=True, host="0.0.0.0", port=8000)
     except Exception as e:
         print(f"Error starting app: {e}")
         import traceback
 
         traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
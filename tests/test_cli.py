@@ -79,6 +79,13 @@ def test_convert_no_pretty_flag(runner, sample_pdf):
     assert "Converting" in result.output or result.exit_code != 0
 
 
+def test_convert_rejects_zero_workers(runner, sample_pdf):
+    """Test that --workers must be at least 1."""
+    result = runner.invoke(main, [str(sample_pdf), "--workers", "0"])
+    assert result.exit_code != 0
+    assert "--workers" in result.output
+
+
 def test_convert_default_output(runner, sample_pdf):
     """Test converting with default output path."""
     result = runner.invoke(main, [str(sample_pdf)])
@@ -154,6 +154,29 @@ def test_convert_page(sample_pdf):
         assert page_data["number"] == 1
 
 
+def test_convert_page_is_cached(multi_page_pdf, monkeypatch):
+    """Test that repeat page conversions reuse the first result."""
+    with PDFToXMLConverter(multi_page_pdf) as converter:
+        monkeypatch.setattr(converter, "PAGE_CACHE_SIZE", 1)
+        first = converter.convert_page(2)
+        first["blocks"].clear()
+
+        def fail_convert(*args, **kwargs):
+            raise AssertionError("cached page should not be converted again")
+
+        with monkeypatch.context() as m:
+            m.setattr(converter, "_convert_page_dict", fail_convert)
+            second = converter.convert_page(2)
+
+        # Mutating a returned page leaves the cached copy intact
+        assert second["number"] == 2
+        assert second["blocks"]
+
+        # The oldest page is evicted once the cache is full
+        converter.convert_page(3)
+        assert list(converter._page_cache) == [("page", 3, False, True)]
+
+
 def test_convert_page_with_tables(sample_pdf):
     """Test converting single page with table extraction."""
     with PDFToXMLConverter(sample_pdf) as converter:
@@ -200,6 +223,67 @@ def test_save_json_no_pretty_print(sample_pdf):
         output_path.unlink(missing_ok=True)
 
 
+def test_save_json_compact_streams_pages(multi_page_pdf, tmp_path, monkeypatch):
+    """Test that compact save_json writes pages without building the document."""
+    output_path = tmp_path / "compact.json"
+
+    with PDFToXMLConverter(multi_page_pdf) as converter:
+        expected = converter.convert(include_metadata=True)
+
+        def fail_convert(*args, **kwargs):
+            raise AssertionError("compact output should be streamed")
+
+        monkeypatch.setattr(converter, "convert", fail_convert)
+        converter.save_json(output_path, include_metadata=True, indent=None)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == expected
+
+
+def test_save_json_streaming_matches_convert(multi_page_pdf, tmp_path):
+    """Test that the streamed file holds the same document as convert()."""
+    output_path = tmp_path / "nested" / "streamed.json"
+
+    with PDFToXMLConverter(multi_page_pdf) as converter:
+        converter.save_json_streaming(output_path, include_metadata=True)
+        expected = converter.convert(include_metadata=True)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == expected
+
+
+def test_save_json_cache_dir(sample_pdf, tmp_path, monkeypatch):
+    """Test that a cached conversion is reused for an unchanged PDF."""
+    cache_dir = tmp_path / "cache"
+
+    with PDFToXMLConverter(sample_pdf) as converter:
+        converter.save_json(tmp_path / "first.json", cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        def fail_convert(*args, **kwargs):
+            raise AssertionError("cache hit should not convert")
+
+        monkeypatch.setattr(converter, "convert", fail_convert)
+        converter.save_json(tmp_path / "second.json", cache_dir=cache_dir)
+
+    assert (tmp_path / "second.json").read_bytes() == (tmp_path / "first.json").read_bytes()
+
+
+def test_save_json_without_orjson(sample_pdf, tmp_path, monkeypatch):
+    """Test the standard library fallback when orjson is not installed."""
+    from estimatex import converter as converter_module
+
+    monkeypatch.setattr(converter_module, "orjson", None)
+    output_path = tmp_path / "plain.json"
+    streamed_path = tmp_path / "streamed.json"
+
+    with PDFToXMLConverter(sample_pdf) as converter:
+        converter.save_json(output_path)
+        converter.save_json_streaming(streamed_path)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == json.loads(
+        streamed_path.read_text(encoding="utf-8")
+    )
+
+
 def test_close_method(sample_pdf):
     """Test explicit close method."""
     converter = PDFToXMLConverter(sample_pdf)
@@ -221,6 +305,15 @@ def test_corrupted_pdf():
         corrupted_path.unlink(missing_ok=True)
 
 
+def test_open_from_file_above_memory_limit(sample_pdf, monkeypatch):
+    """Test that PDFs over the in-memory limit are opened from disk."""
+    monkeypatch.setattr(PDFToXMLConverter, "IN_MEMORY_OPEN_LIMIT", 0)
+
+    with PDFToXMLConverter(sample_pdf) as converter:
+        assert converter.doc.name == str(Path(sample_pdf))
+        assert "Hello World!" in converter.get_page_text(1)
+
+
 def test_convert_with_special_chars(pdf_with_special_chars):
     """Test converting PDF with special characters."""
     with PDFToXMLConverter(pdf_with_special_chars) as converter:
@@ -244,6 +337,28 @@ def test_multi_page_conversion(multi_page_pdf):
             assert page["number"] == i + 1
 
 
+def test_multi_page_conversion_with_workers(multi_page_pdf):
+    """Test that converting in worker processes matches the sequential result."""
+    with PDFToXMLConverter(multi_page_pdf) as converter:
+        sequential = converter.convert()
+        parallel = converter.convert(workers=2)
+
+    assert parallel == sequential
+
+
+def test_convert_without_plain_text(multi_page_pdf):
+    """Test that include_text=False drops only the page text."""
+    with PDFToXMLConverter(multi_page_pdf) as converter:
+        full = converter.convert()
+        blocks_only = converter.convert(include_text=False)
+
+    pages = zip(blocks_only["document"]["pages_data"], full["document"]["pages_data"])
+    for page, full_page in pages:
+        assert "text" not in page
+        assert "text" in full_page
+        assert page["blocks"] == full_page["blocks"]
+
+
 def test_convert_all_pages_with_tables(multi_page_pdf):
     """Test converting all pages with table extraction."""
     with PDFToXMLConverter(multi_page_pdf) as converter:
@@ -289,6 +404,29 @@ def test_detect_tables_empty_page():
         Path(pdf_path).unlink(missing_ok=True)
 
 
+def test_detect_tables_ruled_table(tmp_path):
+    """Test that a table drawn with ruling lines is still detected."""
+    pdf_path = tmp_path / "ruled.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    for row in range(3):
+        for col in range(3):
+            rect = fitz.Rect(50 + col * 100, 50 + row * 30, 150 + col * 100, 80 + row * 30)
+            page.draw_rect(rect, color=(0, 0, 0), width=1)
+            page.insert_text((rect.x0 + 5, rect.y0 + 20), f"R{row}C{col}", fontsize=10)
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((50, 50), "Prose page without drawings", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    with PDFToXMLConverter(pdf_path) as converter:
+        tables = converter._detect_tables(converter.doc[0])
+        assert len(tables) == 1
+        assert tables[0]["row_count"] == 3
+        assert tables[0]["rows"][2][2] == "R2C2"
+        assert converter._detect_tables(converter.doc[1]) == []
+
+
 def test_path_object_initialization(sample_pdf):
     """Test initialization with Path object."""
     path_obj = Path(sample_pdf)
@@ -548,6 +548,7 @@ def test_create_master_verifies_indexes(temp_dir, sample_db):
         "idx_rate",
         "idx_unit",
         "idx_category_code",
+        "idx_dsr_codes_cover",
     ]
 
     for expected_index in expected_indexes:
@@ -556,6 +557,22 @@ def test_create_master_verifies_indexes(temp_dir, sample_db):
     conn.close()
 
 
+def test_migrate_adds_covering_index_and_statistics(temp_dir, sample_db):
+    """Test that migrated databases get the code lookup index and planner stats."""
+    new_db = temp_dir / "migrated.db"
+    migrate_existing_database(sample_db, new_db, category="civil")
+
+    conn = sqlite3.connect(new_db)
+    index = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_dsr_codes_cover'"
+    ).fetchone()
+    stats = conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0]
+    conn.close()
+
+    assert index is not None
+    assert stats > 0
+
+
 def test_migrate_preserves_all_data(temp_dir, sample_db):
     """Test that migration preserves all data fields."""
     new_db = temp_dir / "migrated.db"
@@ -37,9 +37,11 @@ from match_dsr_rates_sqlite import (
     load_input_file,
     load_dsr_database,
     match_with_database,
+    _summarize_matches,
     main as match_main,
     parse_arguments as parse_match_args,
 )
+from text_similarity import calculate_text_similarity
 
 
 @pytest.fixture
@@ -720,6 +722,19 @@ class TestMatchDSRRates:
 
         conn.close()
 
+    def test_load_dsr_database_is_read_only(self, temp_dir, sample_dsr_db):
+        """Test that loading opens the database read-only and leaves it unchanged."""
+        before = sample_dsr_db.read_bytes()
+
+        conn = load_dsr_database(sample_dsr_db)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("CREATE INDEX idx_test ON dsr_codes(code)")
+        finally:
+            conn.close()
+
+        assert sample_dsr_db.read_bytes() == before
+
     def test_load_dsr_database_not_found(self, temp_dir):
         """Test loading nonexistent database."""
         with pytest.raises(FileNotFoundError):
@@ -768,6 +783,28 @@ class TestMatchDSRRates:
         assert matched[0]["rate"] == 450.00
         # May be "code_match_but_description_mismatch" if similarity is low
 
+    def test_match_with_database_mismatch_reports_real_score(self, temp_dir, sample_dsr_db):
+        """Test that mismatch rows keep the actual similarity, not 0.0."""
+        description = "Earth work in excavation by mechanical means"
+        lko_items = [
+            {
+                "dsr_code": "15.12.2",
+                "clean_dsr_code": "15.12.2",
+                "description": description,
+                "quantity": 10,
+                "unit": "cum",
+            }
+        ]
+
+        conn = load_dsr_database(sample_dsr_db)
+        matched = match_with_database(lko_items, conn, similarity_threshold=0.9)
+        conn.close()
+
+        expected = calculate_text_similarity(description, "Excavation in ordinary soil")
+        assert matched[0]["match_type"] == "code_match_but_description_mismatch"
+        assert 0.0 < expected < 0.9
+        assert matched[0]["similarity_score"] == pytest.approx(expected)
+
     def test_match_with_database_not_found(self, temp_dir, sample_dsr_db):
         """Test matching with code not in database."""
         lko_items = [
@@ -826,6 +863,53 @@ class TestMatchDSRRates:
         # Third should not match
         assert matched[2]["match_type"] == "not_found"
 
+    def test_match_with_database_across_query_batches(self, temp_dir, sample_dsr_db):
+        """Test that codes split across lookup batches all match in input order."""
+        from unittest.mock import patch
+
+        lko_items = [
+            {"dsr_code": code, "clean_dsr_code": code, "description": "Work", "quantity": 1}
+            for code in ["15.7.4", "99.99.99", "15.12.2", "15.7.4"]
+        ]
+
+        conn = load_dsr_database(sample_dsr_db)
+        with patch("match_dsr_rates_sqlite._QUERY_BATCH_SIZE", 1):
+            matched = match_with_database(lko_items, conn, similarity_threshold=0.0)
+        conn.close()
+
+        assert [item["dsr_code"] for item in matched] == ["15.7.4", "99.99.99", "15.12.2", "15.7.4"]
+        assert [item["match_type"] == "not_found" for item in matched] == [
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert matched[2]["rate"] == 450.00
+
+    def test_match_with_database_numeric_codes(self, temp_dir, sample_dsr_db):
+        """Test that numeric codes from JSON input match their text rows."""
+        conn = sqlite3.connect(sample_dsr_db)
+        conn.execute(
+            "INSERT INTO dsr_codes VALUES "
+            "('15.7', 'Chapter 15', 'Section 7', 'Brick work', 'cum', 300.0, 'Vol I', 1, '')"
+        )
+        conn.commit()
+        conn.close()
+        lko_items = [
+            {"dsr_code": 15.7, "description": "Brick work", "quantity": 2},
+            {"dsr_code": "15.12.2", "description": "Excavation in ordinary soil", "quantity": 1},
+            {"dsr_code": None, "description": "Unknown", "quantity": 1},
+        ]
+
+        conn = load_dsr_database(sample_dsr_db)
+        matched = match_with_database(lko_items, conn, verbose=False)
+        conn.close()
+
+        assert matched[0]["match_type"] == "exact_with_description_match"
+        assert matched[0]["rate"] == 300.0
+        assert matched[1]["rate"] == 450.00
+        assert matched[2]["match_type"] == "not_found"
+
     def test_match_main_function(
         self, temp_dir, sample_dsr_db, sample_input_file_structured, capsys
     ):
@@ -855,6 +939,26 @@ class TestMatchDSRRates:
         captured = capsys.readouterr()
         assert "MATCHING SUMMARY" in captured.out
 
+    def test_summarize_matches(self):
+        """Test match type counts and amount total in the summary."""
+        items = [
+            {"match_type": "exact_with_description_match", "amount": 100.0},
+            {"match_type": "exact_with_description_match", "amount": None},
+            {"match_type": "code_match_but_description_mismatch", "amount": 50.5},
+            {"match_type": "not_found"},
+        ]
+
+        summary = _summarize_matches(items)
+
+        assert summary == {
+            "total_items": 4,
+            "exact_matches": 2,
+            "code_match_description_mismatch": 1,
+            "not_found": 1,
+            "total_estimated_amount": 150.5,
+        }
+        assert _summarize_matches([])["total_estimated_amount"] == 0
+
 
 # =============================================================================
 # Argument parsing tests
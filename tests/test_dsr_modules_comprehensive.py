@@ -666,6 +666,16 @@ class TestExtractDSRCodeFromLines:
         assert clean_code == "15.12.2"
         assert "15.12.2" in dsr_code
 
+    def test_pre_stripped_blocks(self):
+        """Test that pre-stripped lines give the same result as raw blocks."""
+        blocks = [{"lines": [" DSR- ", "2024 "]}, {"lines": ["  15.12.2  "]}]
+        stripped_blocks = [[str(l).strip() for l in b["lines"]] for b in blocks]
+
+        result = extract_dsr_code_from_lines(blocks[1]["lines"], 1, blocks, stripped_blocks)
+
+        assert result == extract_dsr_code_from_lines(blocks[1]["lines"], 1, blocks)
+        assert result == ("DSR-2024-15.12.2", "15.12.2")
+
 
 class TestExtractItemDetails:
     """Tests for extract_item_details."""
@@ -206,11 +206,33 @@ class TestDSRMatcherHelperAdvanced:
         result = matcher.search_by_code("1.1")
 
         assert result is not None
+        assert type(result) is dict
         assert result["code"] == "1.1"
         assert "Excavation" in result["description"]
 
         matcher.close()
 
+    def test_init_does_not_modify_database(self, sample_dsr_rates_db):
+        """Test that opening the matcher leaves the database unchanged."""
+        before = sample_dsr_rates_db.read_bytes()
+
+        with DSRMatcherHelper(sample_dsr_rates_db) as matcher:
+            matcher.search_by_code("1.1")
+
+        assert sample_dsr_rates_db.read_bytes() == before
+
+    def test_code_lookup_uses_indexes(self, sample_dsr_rates_db):
+        """Test that create_code_indexes adds indexes the code lookup uses."""
+        with DSRMatcherHelper(sample_dsr_rates_db) as matcher:
+            matcher.create_code_indexes()
+            plan = matcher.conn.execute(
+                "EXPLAIN QUERY PLAN " + matcher._CODE_SQL, ("1.1", "1.1")
+            ).fetchall()
+
+        details = " ".join(row[3] for row in plan)
+        assert "idx_dsr_rates_clean_code" in details
+        assert "idx_dsr_rates_code" in details
+
     def test_search_by_code_with_whitespace(self, sample_dsr_rates_db):
         """Test searching with whitespace in code."""
         matcher = DSRMatcherHelper(sample_dsr_rates_db)
@@ -380,6 +402,43 @@ class TestQuickMatch:
         with pytest.raises(FileNotFoundError, match="Could not auto-detect"):
             quick_match(items)
 
+    def test_quick_match_detects_database_created_later(self, temp_dir, sample_dsr_db, monkeypatch):
+        """Test that a failed auto-detection is retried once the database exists."""
+        monkeypatch.chdir(temp_dir)
+        items = [{"dsr_code": "1.1", "description": "Excavation", "quantity": 100}]
+
+        with pytest.raises(FileNotFoundError):
+            quick_match(items)
+
+        shutil.copy(sample_dsr_db, temp_dir / "DSR_combined.db")
+        assert len(quick_match(items)) > 0
+        assert len(quick_match(items)) > 0
+
+    def test_quick_match_detects_database_removed_later(self, temp_dir, sample_dsr_db, monkeypatch):
+        """Test that a cached auto-detected path is dropped once the file is gone."""
+        monkeypatch.chdir(temp_dir)
+        items = [{"dsr_code": "1.1", "description": "Excavation", "quantity": 100}]
+        shutil.copy(sample_dsr_db, temp_dir / "DSR_combined.db")
+        assert len(quick_match(items)) > 0
+
+        (temp_dir / "DSR_combined.db").unlink()
+        with pytest.raises(FileNotFoundError, match="Could not auto-detect"):
+            quick_match(items)
+
+    def test_detects_higher_priority_database_created_later(
+        self, temp_dir, sample_dsr_db, monkeypatch
+    ):
+        """Test that a preferred database created after detection replaces the cached one."""
+        from estimatex.helpers import _detect_dsr_database
+
+        shutil.copy(sample_dsr_db, temp_dir / "DSR_combined.db")
+        assert _detect_dsr_database(str(temp_dir)) == temp_dir / "DSR_combined.db"
+
+        preferred = temp_dir / "data" / "reference" / "DSR_combined.db"
+        preferred.parent.mkdir(parents=True)
+        shutil.copy(sample_dsr_db, preferred)
+        assert _detect_dsr_database(str(temp_dir)) == preferred
+
 
 # =============================================================================
 # Tests for batch_convert_pdfs
@@ -451,6 +510,64 @@ class TestBatchConvertPDFs:
             content = f.read()
             assert "  " in content
 
+    def test_batch_convert_in_worker_processes(self, temp_dir):
+        """Test parallel batch conversion matches converting each file alone."""
+        import fitz
+
+        for i in range(3):
+            doc = fitz.open()
+            page = doc.new_page()
+            page.insert_text((50, 50), f"Parallel {i}")
+            doc.save(str(temp_dir / f"doc{i}.pdf"))
+            doc.close()
+        (temp_dir / "broken.pdf").write_text("not a pdf")
+
+        converted = batch_convert_pdfs(temp_dir, temp_dir / "out", max_workers=2)
+
+        assert sorted(f.name for f in converted) == ["doc0.json", "doc1.json", "doc2.json"]
+        for output_file in converted:
+            data = json.loads(output_file.read_text())
+            assert data["document"]["source"] == output_file.with_suffix(".pdf").name
+
+    @pytest.mark.parametrize("file_count, expected_workers", [(2, 1), (4, None)])
+    def test_batch_convert_few_files_stays_in_process(
+        self, temp_dir, monkeypatch, file_count, expected_workers
+    ):
+        """Test that a handful of files is converted without a process pool."""
+        from estimatex.converter import PDFToXMLConverter
+
+        for i in range(file_count):
+            (temp_dir / f"doc{i}.pdf").write_bytes(b"%PDF")
+        calls = []
+        monkeypatch.setattr(
+            PDFToXMLConverter,
+            "convert_files",
+            lambda pairs, max_workers=None, **kwargs: calls.append(max_workers) or [],
+        )
+
+        batch_convert_pdfs(temp_dir)
+
+        assert calls == [expected_workers]
+
+    def test_batch_convert_missing_directory(self, temp_dir):
+        """Test that a missing PDF directory converts nothing instead of raising."""
+        assert batch_convert_pdfs(temp_dir / "missing", temp_dir / "out") == []
+
+    def test_batch_convert_skips_non_pdf_entries(self, temp_dir):
+        """Test that only regular *.pdf files are picked up."""
+        import fitz
+
+        doc = fitz.open()
+        doc.new_page().insert_text((50, 50), "Only")
+        doc.save(str(temp_dir / "only.pdf"))
+        doc.close()
+        (temp_dir / "folder.pdf").mkdir()
+        (temp_dir / "notes.txt").write_text("skip me")
+
+        converted = batch_convert_pdfs(temp_dir, temp_dir / "out", max_workers=1)
+
+        assert [f.name for f in converted] == ["only.json"]
+
     def test_batch_convert_empty_directory(self, temp_dir):
         """Test batch conversion with no PDFs."""
         converted = batch_convert_pdfs(temp_dir)
@@ -607,3 +724,41 @@ class TestGetVersionInfo:
         # Should have either detected version or fallback
         assert isinstance(info["estimatex"], str)
         assert len(info["estimatex"]) > 0
+
+    def test_get_version_info_is_cached_copy(self):
+        """Test that repeated calls reuse the lookup but hand out independent dicts."""
+        info = get_version_info()
+        info["flask"] = "changed"
+
+        again = get_version_info()
+        assert again["flask"] != "changed"
+        assert again == get_version_info()
+
+
+class TestPackageExports:
+    """Tests for the package-level lazy exports."""
+
+    def test_import_does_not_load_scripts(self):
+        """Test that importing the package leaves PyMuPDF, Flask, the matcher and sys.path alone."""
+        import subprocess
+
+        src_dir = Path(__file__).parent.parent / "src"
+        code = (
+            "import sys; sys.path.insert(0, %r); n = len(sys.path); import estimatex; "
+            "print('fitz' in sys.modules, 'flask' in sys.modules, "
+            "'match_dsr_rates_sqlite' in sys.modules, "
+            "len(sys.path) != n)" % str(src_dir)
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines()[-1] == "False False False False"
+
+    def test_lazy_export_resolves_on_access(self):
+        """Test that script-backed names resolve on first access."""
+        import estimatex
+
+        assert callable(estimatex.calculate_text_similarity)
+        assert "calculate_text_similarity" in dir(estimatex)
+        with pytest.raises(AttributeError):
+            estimatex.not_an_export
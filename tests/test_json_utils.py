@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for json_utils.py script."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import json_utils
+from json_utils import read_json_file, write_json_file
+
+SAMPLE = {"items": [{"code": "15.12.2", "description": "Cement – concrete", "rate": 1.5}]}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    """Run each test with and without orjson."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+    else:
+        with patch.object(json_utils, "orjson", None):
+            yield request.param
+
+
+def test_write_json_file_indented(tmp_path, backend):
+    """Test that the default output matches json.dump(indent=2)."""
+    output = tmp_path / "out.json"
+
+    write_json_file(SAMPLE, output)
+
+    text = output.read_text(encoding="utf-8")
+    assert text == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_write_json_file_compact(tmp_path, backend):
+    """Test compact output round-trips without whitespace."""
+    output = tmp_path / "out.json"
+
+    write_json_file(SAMPLE, output, indent=False)
+
+    text = output.read_text(encoding="utf-8")
+    assert "\n" not in text
+    assert json.loads(text) == SAMPLE
+
+
+def test_read_json_file_round_trip(tmp_path, backend):
+    """Test reading back a file written by the standard library."""
+    path = tmp_path / "in.json"
+    path.write_text(json.dumps(SAMPLE, ensure_ascii=False), encoding="utf-8")
+
+    assert read_json_file(path) == SAMPLE
+
+
+def test_read_json_file_invalid(tmp_path, backend):
+    """Test that invalid JSON raises json.JSONDecodeError."""
+    path = tmp_path / "bad.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(path)
@@ -75,6 +75,20 @@ def test_structured_formatter():
     assert "{" in formatted
 
 
+def test_structured_formatter_uses_record_time():
+    """Test that the JSON timestamp is the record's creation time in UTC."""
+    import json
+
+    formatter = StructuredFormatter()
+    record = logging.LogRecord("test", logging.INFO, "test.py", 10, "Test message", (), None)
+    record.created = 1700000000.25
+
+    data = json.loads(formatter.format(record))
+
+    assert data["timestamp"] == "2023-11-14T22:13:20.250000Z"
+    assert data["message"] == "Test message"
+
+
 def test_human_readable_formatter():
     """Test human-readable formatter."""
     formatter = HumanReadableFormatter()
@@ -136,3 +150,17 @@ def test_setup_logging_idempotent():
 
     assert isinstance(logger1, logging.Logger)
     assert isinstance(logger2, logging.Logger)
+
+
+def test_human_readable_formatter_colors_level(monkeypatch):
+    """Test that known levels are colored and unknown ones pass through."""
+    import sys
+
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True, raising=False)
+    formatter = HumanReadableFormatter(use_colors=True)
+
+    record = logging.LogRecord("test", logging.INFO, "test.py", 10, "Colored", (), None)
+    assert "\033[32mINFO\033[0m" in formatter.format(record)
+
+    record = logging.LogRecord("test", 5, "test.py", 10, "Custom level", (), None)
+    assert " | Level 5 | " in formatter.format(record)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for logging_utils.py script."""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from logging_utils import setup_script_logging
+
+
+@pytest.fixture
+def script_logger():
+    """Close the test logger's handlers after each test."""
+    yield "test_logging_utils_script"
+    logger = logging.getLogger("test_logging_utils_script")
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def _file_handler(logger):
+    return next(h.target for h in logger.handlers if hasattr(h, "target"))
+
+
+def test_log_dir_created_on_first_write(tmp_path, script_logger):
+    """Test that the log directory is only created once a record is written."""
+    log_dir = tmp_path / "logs"
+    logger = setup_script_logging(script_logger, log_dir=log_dir)
+
+    assert not log_dir.exists()
+
+    logger.warning("disk nearly full")
+    assert list(log_dir.glob("*.log"))
+
+
+def test_warnings_flush_immediately(tmp_path, script_logger):
+    """Test that warnings are written without waiting for the buffer to fill."""
+    logger = setup_script_logging(script_logger, log_dir=tmp_path)
+
+    logger.info("buffered")
+    assert not list(tmp_path.glob("*.log"))
+
+    logger.warning("flushed")
+    text = next(tmp_path.glob("*.log")).read_text(encoding="utf-8")
+    assert "buffered" in text
+    assert "flushed" in text
+
+
+def test_setup_again_closes_previous_file(tmp_path, script_logger):
+    """Test that re-running setup closes the previous log file handle."""
+    logger = setup_script_logging(script_logger, log_dir=tmp_path)
+    logger.warning("open the file")
+    old_file_handler = _file_handler(logger)
+    assert old_file_handler.stream is not None
+
+    logger = setup_script_logging(script_logger, log_dir=tmp_path)
+
+    assert old_file_handler.stream is None
+    assert _file_handler(logger) is not old_file_handler
@@ -175,3 +175,33 @@ def test_get_all_text_blocks_whitespace():
     assert "More valid text" in texts
     # Whitespace-only lines should be filtered
     assert "   " not in texts
+
+
+@pytest.mark.parametrize("use_ijson", [True, False])
+def test_iter_text_blocks_from_file(temp_json_file, sample_json_data, use_ijson):
+    """Test streaming text lines from a file with and without ijson."""
+    from unittest.mock import patch
+
+    import read_json
+
+    if use_ijson and read_json.ijson is None:
+        pytest.skip("ijson not installed")
+
+    backend = read_json.ijson if use_ijson else None
+    with patch.object(read_json, "ijson", backend):
+        texts = list(read_json.iter_text_blocks_from_file(temp_json_file))
+
+    assert texts == get_all_text_blocks(sample_json_data)
+
+
+def test_make_matcher_literal_and_regex():
+    """Test that literal and regex terms both match case-insensitively."""
+    from read_json import make_matcher
+
+    literal = make_matcher("plinth AREA")
+    assert literal("Plinth Area Rates")
+    assert not literal("Plinth rates")
+
+    regex = make_matcher(r"line.*text")
+    assert regex("First LINE of text")
+    assert not regex("Another block")
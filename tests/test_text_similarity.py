@@ -96,3 +96,91 @@ def test_numeric_code_matching():
 
     assert sim_exact == 1.0
     assert 0.7 <= sim_close < 1.0  # Similar but not identical
+
+
+def test_sequence_ratio_without_rapidfuzz():
+    """Test the pure-Python fallback used when rapidfuzz is not installed."""
+    from unittest.mock import patch
+
+    import text_similarity
+
+    calculate_text_similarity.cache_clear()
+    try:
+        with patch.object(text_similarity, "_fuzz_ratio", None):
+            assert calculate_text_similarity("Brick work", "Brick work") == 1.0
+            assert 0.7 <= calculate_text_similarity("15.12.2", "15.12.3") < 1.0
+            assert text_similarity._sequence_ratio("", "") == 1.0
+    finally:
+        calculate_text_similarity.cache_clear()
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_sequence_ratio_same_for_both_backends(monkeypatch, use_rapidfuzz):
+    """Test that rapidfuzz and the fallback report the same Indel ratio."""
+    import text_similarity
+
+    if use_rapidfuzz:
+        pytest.importorskip("rapidfuzz")
+    else:
+        monkeypatch.setattr(text_similarity, "_fuzz_ratio", None)
+
+    calculate_text_similarity.cache_clear()
+    ratio = text_similarity._sequence_ratio(
+        "excavation in ordinary soil", "earth work in excavation by mechanical means"
+    )
+    assert ratio == pytest.approx(32 / 71)
+    score = calculate_text_similarity(
+        "Excavation in ordinary soil", "Earth work in excavation by mechanical means"
+    )
+    assert score == pytest.approx(0.382, abs=1e-3)
+    calculate_text_similarity.cache_clear()
+    assert text_similarity._sequence_ratio("15.12.2", "15.12.3") == pytest.approx(12 / 14)
+    assert text_similarity._sequence_ratio("abc", "") == 0.0
+
+
+def test_similarity_is_memoized():
+    """Test that repeated description pairs are served from the cache."""
+    calculate_text_similarity.cache_clear()
+
+    first = calculate_text_similarity("Brick work in superstructure", "Brick work")
+    second = calculate_text_similarity("Brick work in superstructure", "Brick work")
+
+    assert first == second
+    assert calculate_text_similarity.cache_info().hits == 1
+
+
+def test_min_similarity_length_bound():
+    """Test that min_similarity only zeroes pairs that cannot reach it."""
+    short = "Brick"
+    long = "Brick work in superstructure with cement mortar 1:6 above plinth level"
+
+    assert calculate_text_similarity(short, long, 0.5) == 0.0
+    full = calculate_text_similarity("Brick work in cement", "Brick work in lime")
+    assert calculate_text_similarity("Brick work in cement", "Brick work in lime", 0.5) == full
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_min_similarity_cutoff_agrees_with_full_score(monkeypatch, use_rapidfuzz):
+    """Test that min_similarity keeps scores that reach it and zeroes the rest."""
+    import text_similarity
+
+    if not use_rapidfuzz:
+        monkeypatch.setattr(text_similarity, "_fuzz_ratio", None)
+    calculate_text_similarity.cache_clear()
+
+    texts = [
+        "Earth work in excavation by mechanical means",
+        "Excavation in foundation trenches or drains",
+        "Brick work with common burnt clay bricks",
+        "Brick work in superstructure with cement mortar",
+        "Cement concrete 1:2:4 in foundation",
+        "Providing and laying cement concrete",
+        "Steel reinforcement for R.C.C. work",
+    ]
+    for a in texts:
+        for b in texts:
+            full = calculate_text_similarity(a, b)
+            for threshold in (0.2, 0.3, 0.5, 0.7, full):
+                cut = calculate_text_similarity(a, b, threshold)
+                assert cut == (full if full >= threshold else 0.0)
+    calculate_text_similarity.cache_clear()
@@ -20,6 +20,7 @@ from update_dsr_database import (
     increment_version,
     show_version_history,
     update_rate,
+    bulk_update_rates,
     update_description,
     batch_update_from_csv,
     add_new_code,
@@ -371,6 +372,42 @@ def test_update_description_dry_run(sample_db, capsys):
     assert "DRY RUN" in captured.out
 
 
+# =============================================================================
+# Tests for bulk_update_rates
+# =============================================================================
+
+
+def test_bulk_update_rates(sample_db, capsys):
+    """Test updating several rates in one transaction."""
+    version_before = get_current_version(sample_db)
+
+    updated = bulk_update_rates(
+        sample_db, [("15.12.2", None, 120.0), ("16.3.1", "civil", 260.0), ("99.9", "civil", 1.0)]
+    )
+
+    assert updated == 3
+    assert get_current_version(sample_db) == version_before + 1
+
+    conn = sqlite3.connect(sample_db)
+    rates = dict(conn.execute("SELECT code || '/' || category, rate FROM dsr_codes").fetchall())
+    conn.close()
+    assert rates["15.12.2/civil"] == 120.0
+    assert rates["15.12.2/electrical"] == 120.0
+    assert rates["16.3.1/civil"] == 260.0
+    assert rates["1.1.1/civil"] == 15.0
+
+
+def test_bulk_update_rates_dry_run(sample_db, capsys):
+    """Test that a dry run leaves rates untouched."""
+    assert bulk_update_rates(sample_db, [("16.3.1", "civil", 260.0)], dry_run=True) == 0
+
+    conn = sqlite3.connect(sample_db)
+    rate = conn.execute("SELECT rate FROM dsr_codes WHERE code = '16.3.1'").fetchone()[0]
+    conn.close()
+    assert rate == 250.0
+    assert "DRY RUN" in capsys.readouterr().out
+
+
 # =============================================================================
 # Tests for batch_update_from_csv
 # =============================================================================
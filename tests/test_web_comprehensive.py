@@ -6,6 +6,7 @@ Focuses on uncovered routes and edge cases.
 
 import pytest
 import json
+import os
 import tempfile
 from pathlib import Path
 import sys
@@ -207,9 +208,20 @@ def test_view_csv_file(client, sample_csv, monkeypatch):
 
 
 def test_view_markdown_file(client, sample_markdown, monkeypatch):
-    """Test viewing Markdown file."""
-    # Similar complexity - would need to mock path resolution
-    pass
+    """Test viewing Markdown file, rendered once per file version."""
+    import estimatex.web as web
+
+    monkeypatch.setattr(web, "EXAMPLES", sample_markdown.parent)
+    web._markdown_view.cache_clear()
+
+    for _ in range(2):
+        response = client.get(f"/view/{sample_markdown.name}")
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert "<strong>test</strong>" in html
+        assert "This is a **test** markdown file." in html  # raw view
+
+    assert web._markdown_view.cache_info().hits == 1
 
 
 def test_view_matched_rates_json(client, sample_matched_rates_json, monkeypatch):
@@ -224,6 +236,46 @@ def test_view_json_file_not_found(client):
     assert response.status_code == 302  # Redirect to index
 
 
+def test_view_raw_json_matches_stdlib_format(client, temp_dir, monkeypatch):
+    """Test that raw JSON is shown with the same formatting with or without orjson."""
+    import estimatex.web as web
+
+    data = {"document": {"source": "Nirmāṇ.pdf", "pages": 1, "rate": 12.5, "tags": [], "x": {}}}
+    (temp_dir / "raw.json").write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(web, "EXAMPLES", temp_dir)
+    expected = json.dumps(data, indent=2, ensure_ascii=False)
+
+    response = client.get("/view/raw.json")
+    assert expected in response.get_data(as_text=True)
+
+    monkeypatch.setattr(web, "orjson", None)
+    response = client.get("/view/raw.json")
+    assert expected in response.get_data(as_text=True)
+
+
+def test_view_raw_json_etag(client, temp_dir, monkeypatch):
+    """Test that raw JSON views send an ETag and answer 304 until the file changes."""
+    import estimatex.web as web
+
+    json_file = temp_dir / "etag.json"
+    json_file.write_text(json.dumps({"value": 1}))
+    monkeypatch.setattr(web, "EXAMPLES", temp_dir)
+
+    response = client.get("/view/etag.json")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+
+    response = client.get("/view/etag.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    json_file.write_text(json.dumps({"value": 22}))
+    stat = json_file.stat()
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    response = client.get("/view/etag.json", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert '"value": 22' in response.get_data(as_text=True)
+
+
 def test_view_json_different_path_prefixes(client):
     """Test various filepath prefix handling."""
     # Test input_files/ prefix
@@ -270,6 +322,123 @@ def test_search_with_results(client, temp_dir, monkeypatch):
     assert response.status_code == 200
 
 
+def test_search_reuses_parsed_files(client, temp_dir, monkeypatch):
+    """Test that search finds matches and reparses a file only after it changes."""
+    import estimatex.web as web
+
+    monkeypatch.setattr(web, "INPUT_FILES", temp_dir)
+    json_file = temp_dir / "cached.json"
+    json_file.write_text(json.dumps({"pages": [{"blocks": [{"lines": ["Earth excavation"]}]}]}))
+    web._searchable_texts.cache_clear()
+
+    response = client.post("/search", data={"search_term": "EXCAVATION"})
+    assert response.status_code == 200
+    assert b"cached.json" in response.data
+
+    client.post("/search", data={"search_term": "earth"})
+    assert web._searchable_texts.cache_info().hits >= 1
+
+    json_file.write_text(json.dumps({"pages": [{"blocks": [{"lines": ["Brick masonry"]}]}]}))
+    stat = json_file.stat()
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    response = client.post("/search", data={"search_term": "masonry"})
+    assert b"cached.json" in response.data
+
+
+def test_search_rereads_file_rewritten_within_same_mtime(client, temp_dir, monkeypatch):
+    """Test that a rewrite keeping the old mtime is still picked up through its size."""
+    import estimatex.web as web
+
+    monkeypatch.setattr(web, "INPUT_FILES", temp_dir)
+    json_file = temp_dir / "same_mtime.json"
+    json_file.write_text(json.dumps({"pages": [{"blocks": [{"lines": ["Plaster"]}]}]}))
+    stat = json_file.stat()
+    client.post("/search", data={"search_term": "plaster"})
+
+    json_file.write_text(json.dumps({"pages": [{"blocks": [{"lines": ["Cement plaster"]}]}]}))
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    response = client.post("/search", data={"search_term": "cement"})
+    assert b"same_mtime.json" in response.data
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("plan.pdf", True),
+        ("PLAN.PDF", True),
+        ("archive.tar.pdf", True),
+        ("plan.pdf.json", False),
+        ("plan", False),
+        (".pdf", False),
+        ("plan.", False),
+    ],
+)
+def test_allowed_file(filename, expected):
+    """Test the upload extension check, including Path.suffix's edge cases."""
+    assert allowed_file(filename) is expected
+    assert allowed_file(filename) is (Path(filename).suffix.lower() == ".pdf")
+
+
+def test_download_json_is_conditional(client, temp_dir, monkeypatch):
+    """Test that an unchanged re-download answers 304 and ranges are honoured."""
+    import estimatex.web as web
+
+    (temp_dir / "report.json").write_text(json.dumps({"total": 1}))
+    monkeypatch.setattr(web, "EXAMPLES", temp_dir)
+
+    response = client.get("/download/report.json")
+    assert response.status_code == 200
+    assert "attachment" in response.headers["Content-Disposition"]
+
+    response = client.get(
+        "/download/report.json", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+    response = client.get("/download/report.json", headers={"Range": "bytes=0-1"})
+    assert response.status_code == 206
+    assert response.data == b'{"'
+
+
+def test_files_by_suffix(temp_dir):
+    """Test one-pass listing of files per suffix, sorted and without directories."""
+    from estimatex.web import _files_by_suffix
+
+    for name in ("b.json", "a.json", "r.csv", "notes.md", "skip.txt"):
+        (temp_dir / name).write_text("{}")
+    (temp_dir / "dir.json").mkdir()
+
+    assert _files_by_suffix(temp_dir, ".json", ".csv", ".md") == {
+        ".json": ["a.json", "b.json"],
+        ".csv": ["r.csv"],
+        ".md": ["notes.md"],
+    }
+    assert _files_by_suffix(temp_dir / "missing", ".json") == {".json": []}
+
+
+def test_find_matches_caps_preview_and_counts_all():
+    """Test that only the first matches are kept while every match is counted."""
+    import re
+    from estimatex.web import _find_matches
+
+    texts = tuple(f"{'brick' if i % 2 else 'stone'} line {i}" for i in range(40))
+    matches, total = _find_matches(re.compile("BRICK", re.IGNORECASE), texts)
+
+    assert matches == [(i, texts[i]) for i in range(1, 20, 2)]
+    assert total == 20
+
+    matches, total = _find_matches(re.compile("line 3"), texts)
+    assert [idx for idx, _ in matches] == [3] + list(range(30, 39))
+    assert total == 11
+    assert _find_matches(re.compile("missing"), texts) == ([], 0)
+
+
+def test_search_invalid_pattern(client):
+    """Test that an invalid regex search term returns no results instead of failing."""
+    response = client.post("/search", data={"search_term": "[unclosed"})
+    assert response.status_code == 200
+
+
 def test_search_complex_json_structure(client):
     """Test search with complex span-based JSON structure."""
     # Tests the span-based line format handling
@@ -320,27 +489,11 @@ def test_cost_estimation_post_valid(client):
 # =============================================================================
 
 
-def test_process_cost_estimation_script_not_found():
-    """Test process_cost_estimation when script is missing."""
-    from estimatex.web import process_cost_estimation
-
-    with patch("pathlib.Path.exists", return_value=False):
-        result = process_cost_estimation("input.json", ["ref.json"])
-        assert result["success"] is False
-        assert "script not found" in result["error"].lower()
-
-
 def test_process_cost_estimation_database_not_found():
     """Test process_cost_estimation when database is missing."""
     from estimatex.web import process_cost_estimation
 
-    def selective_exists(self):
-        # Script exists but database doesn't
-        if "match_dsr_rates" in str(self):
-            return True
-        return False
-
-    with patch.object(Path, "exists", selective_exists):
+    with patch("pathlib.Path.exists", return_value=False):
         result = process_cost_estimation("input.json", ["ref.json"])
         assert result["success"] is False
         assert "database not found" in result["error"].lower()
@@ -350,7 +503,7 @@ def test_process_cost_estimation_input_not_found():
     """Test process_cost_estimation when input file is missing."""
     from estimatex.web import process_cost_estimation
 
-    with patch("pathlib.Path.exists", side_effect=[True, True, False]):
+    with patch("pathlib.Path.exists", side_effect=[True, False]):
         result = process_cost_estimation("nonexistent.json", ["ref.json"])
         assert result["success"] is False
         assert "not found" in result["error"].lower()
@@ -359,29 +512,21 @@ def test_process_cost_estimation_input_not_found():
 def test_process_cost_estimation_script_failure():
     """Test process_cost_estimation when script fails."""
     from estimatex.web import process_cost_estimation
-    import subprocess
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stderr = "Script error"
-    mock_result.stdout = ""
+    matcher = MagicMock()
+    matcher.run_matching.side_effect = RuntimeError("Script error")
 
     with patch("pathlib.Path.exists", return_value=True):
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("estimatex.web.import_script", return_value=matcher):
             result = process_cost_estimation("input.json", ["ref.json"])
             assert result["success"] is False
             assert "failed" in result["error"].lower()
+            assert "Script error" in result["error"]
 
 
 def test_process_cost_estimation_success():
     """Test successful process_cost_estimation."""
     from estimatex.web import process_cost_estimation
-    import subprocess
-
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "Success"
-    mock_result.stderr = ""
 
     output_data = {
         "summary": {
@@ -393,14 +538,62 @@ def test_process_cost_estimation_success():
         },
         "matched_items": [{"code": "1.1", "description": "Test", "rate": 100, "amount": 10000}],
     }
+    matcher = MagicMock()
+    matcher.run_matching.return_value = output_data
 
     with patch("pathlib.Path.exists", return_value=True):
-        with patch("subprocess.run", return_value=mock_result):
-            with patch("builtins.open", return_value=io.StringIO(json.dumps(output_data))):
-                with patch("json.load", return_value=output_data):
-                    result = process_cost_estimation("input.json", ["ref.json"])
-                    assert result["success"] is True
-                    assert result["total_amount"] == 50000
+        with patch("estimatex.web.import_script", return_value=matcher):
+            result = process_cost_estimation("input.json", ["ref.json"])
+            assert result["success"] is True
+            assert result["total_amount"] == 50000
+            assert result["result_file"] == "input_matched_rates.json"
+
+
+def test_process_cost_estimation_runs_matcher_in_process(temp_dir, monkeypatch, capsys):
+    """Test a real in-process match writes the report and keeps stdout quiet."""
+    import sqlite3
+    import estimatex.web as web
+
+    db_path = temp_dir / "DSR_combined.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE dsr_codes (code TEXT PRIMARY KEY, chapter TEXT, section TEXT, "
+        "description TEXT, unit TEXT, rate REAL, volume TEXT, page INTEGER, keywords TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO dsr_codes VALUES ('1.1', 'Earth Work', '', "
+        "'Earth work in excavation', 'cum', 250.0, 'Vol 1', 1, 'earth excavation')"
+    )
+    conn.commit()
+    conn.close()
+
+    input_dir = temp_dir / "input"
+    input_dir.mkdir()
+    (input_dir / "project.json").write_text(
+        json.dumps(
+            {
+                "metadata": {"type": "input_items"},
+                "items": [
+                    {
+                        "code": "1.1",
+                        "description": "Earth work in excavation",
+                        "quantity": 10,
+                        "unit": "cum",
+                    }
+                ],
+            }
+        )
+    )
+    monkeypatch.setattr(web, "REFERENCE_FILES", temp_dir)
+    monkeypatch.setattr(web, "INPUT_FILES", input_dir)
+    monkeypatch.setattr(web, "OUTPUT_REPORTS", temp_dir / "reports")
+
+    result = web.process_cost_estimation("project.json", ["ref.json"])
+
+    assert result["success"] is True, result.get("error")
+    assert result["summary"]["total_items"] == 1
+    assert (temp_dir / "reports" / "project_matched_rates.json").exists()
+    assert capsys.readouterr().out == ""
 
 
 # =============================================================================
@@ -538,3 +731,50 @@ def test_request_timing_tracking(client):
         assert "timestamp" in last_call
         assert "response_time" in last_call
         assert last_call["response_time"] >= 0
+
+
+# =============================================================================
+# Tests for main() server selection
+# =============================================================================
+
+
+def test_main_uses_debug_server_by_default(monkeypatch):
+    """Test that main() runs the Werkzeug server unless PROD=1."""
+    import estimatex.web as web
+
+    calls = []
+    monkeypatch.delenv("PROD", raising=False)
+    monkeypatch.setattr(web.app, "run", lambda **kwargs: calls.append(kwargs))
+
+    web.main()
+
+    assert calls == [{"debug": True, "host": "0.0.0.0", "port": 8000}]
+
+
+def test_main_uses_gunicorn_with_prod(monkeypatch):
+    """Test that PROD=1 hands the app to gunicorn with the configured workers."""
+    import types
+    import estimatex.web as web
+
+    served = {}
+
+    class FakeBaseApplication:
+        def __init__(self):
+            self.cfg = types.SimpleNamespace(set=served.__setitem__)
+            self.load_config()
+
+        def run(self):
+            served["app"] = self.load()
+
+    fake_base = types.ModuleType("gunicorn.app.base")
+    fake_base.BaseApplication = FakeBaseApplication
+    monkeypatch.setitem(sys.modules, "gunicorn", types.ModuleType("gunicorn"))
+    monkeypatch.setitem(sys.modules, "gunicorn.app", types.ModuleType("gunicorn.app"))
+    monkeypatch.setitem(sys.modules, "gunicorn.app.base", fake_base)
+    monkeypatch.setenv("PROD", "1")
+    monkeypatch.setenv("WEB_WORKERS", "2")
+    monkeypatch.setattr(web.app, "run", lambda **kwargs: pytest.fail("debug server started"))
+
+    web.main()
+
+    assert served == {"bind": "0.0.0.0:8000", "workers": 2, "app": web.app}